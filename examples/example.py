@@ -2,7 +2,6 @@
 # export PYTHONPATH="/Users/willwade/GitHub/tts-wrapper:$PYTHONPATH"
 # python examples/example.py
 import sys
-import json
 import logging
 from pathlib import Path
 from tts_wrapper import PollyTTS, PollyClient, MicrosoftTTS, MicrosoftClient, WatsonTTS, WatsonClient, GoogleTTS, GoogleClient, ElevenLabsTTS, ElevenLabsClient,  WitAiTTS, WitAiClient
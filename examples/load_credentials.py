@@ -1,54 +1,102 @@
 import json
 import os
 import platform
+from functools import lru_cache
+from types import SimpleNamespace
 
-def load_credentials(public_json_file='credentials.json'):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=8)
+def _parse_json(json_file, mtime_ns):
+    with open(json_file, 'rb') as file:
+        data = file.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def read_json(json_file):
+    """Parse a JSON file, with orjson when it is installed.
+
+    The result is cached until the file is modified, so reading the same file
+    again does not reopen or reparse it. Treat the returned dict as read-only.
+    """
+    return _parse_json(os.path.abspath(json_file), os.stat(json_file).st_mtime_ns)
+
+def _env_vars(data):
+    """Yield (SERVICE_KEY, value) for every credential in the parsed file."""
+    for service, creds in data.items():
+        prefix = service.upper() + "_"
+        for key, value in creds.items():
+            yield prefix + key.upper(), value
+
+def credentials_set_in_env(data, env_keys=None):
+    """Return True if every SERVICE_KEY variable for the parsed credentials is already set.
+
+    :param env_keys: set of environment variable names to check against, defaults to os.environ
+    """
+    if env_keys is None:
+        env_keys = set(os.environ)
+    return all(env_var in env_keys for env_var, _ in _env_vars(data))
+
+def load_credentials(public_json_file='credentials.json', services=None):
     """
     Load credentials from a public JSON file and optionally from a private JSON file,
-    and set them as environment variables.
+    and set them as environment variables. Variables that are already set are left as they are.
+
+    Each file is only read once per process, later calls with the same file
+    (by absolute path) return the cached result.
     
     :param public_json_file: Path to the public JSON file containing the credentials.
+    :param services: Optional service names (case-insensitive), e.g. {'polly'}; only these
+                     are returned and set in the environment. Defaults to all of them.
+    :return: dict mapping each service name to a SimpleNamespace of its credentials,
+             e.g. load_credentials()['Polly'].aws_key_id
     """
+    if services is not None:
+        services = frozenset(service.lower() for service in services)
+    return _load_credentials(os.path.abspath(public_json_file), services)
+
+@lru_cache(maxsize=None)
+def _load_credentials(public_json_file, services):
     # Construct the path to the private JSON file
     private_json_file = public_json_file.replace('.json', '-private.json')
 
-    def set_env_vars_from_json(json_file):
-        with open(json_file, 'r') as file:
-            data = json.load(file)
-            for service, creds in data.items():
-                for key, value in creds.items():
-                    env_var = f"{service.upper()}_{key.upper()}"
-                    os.environ[env_var] = value
-#                     print(f"Set {env_var} to {value}")
-
-    # Check if private credentials file exists
-    if os.path.exists(private_json_file):
+    def set_env_vars_from_data(data):
+        env_keys = set(os.environ)
+        if not credentials_set_in_env(data, env_keys):
+            os.environ.update({env_var: value for env_var, value in _env_vars(data) if env_var not in env_keys})
+        return {
+            service: SimpleNamespace(**creds)
+            for service, creds in data.items()
+        }
+
+    # Prefer the private credentials file, if there is one
+    try:
 #         print(f"Loading private credentials from {private_json_file}")
-        set_env_vars_from_json(private_json_file)
-    else:
+        data = read_json(private_json_file)
+    except FileNotFoundError:
 #         print(f"Loading public credentials from {public_json_file}")
-        set_env_vars_from_json(public_json_file)
+        data = read_json(public_json_file)
+    if services is not None:
+        data = {service: creds for service, creds in data.items() if service.lower() in services}
+    return set_env_vars_from_data(data)
 
 def set_env_vars_from_json(json_file):
-    with open(json_file, 'r') as file:
-        data = json.load(file)
-        
-        env_vars = {}
-        for service, creds in data.items():
-            for key, value in creds.items():
-                env_var = f"{service.upper()}_{key.upper()}"
-                env_vars[env_var] = value
-                print(f"Set {env_var} to {value}")
-                os.environ[env_var] = value  # Set for the current session
-                
-        if platform.system() == 'Windows':
-            set_env_vars_windows(env_vars)
-        else:
-            set_env_vars_unix(env_vars)
+    env_vars = dict(_env_vars(read_json(json_file)))
+    for env_var, value in env_vars.items():
+        print(f"Set {env_var} to {value}")
+    os.environ.update(env_vars)  # Set for the current session
+            
+    if platform.system() == 'Windows':
+        set_env_vars_windows(env_vars)
+    else:
+        set_env_vars_unix(env_vars)
 
 def set_env_vars_windows(env_vars):
-    for var, value in env_vars.items():
-        command = f'setx {var} "{value}"'
+    # One cmd.exe for all of them rather than a shell per variable
+    command = ' & '.join(f'setx {var} "{value}"' for var, value in env_vars.items())
+    if command:
         os.system(command)
     print("Environment variables set permanently for Windows.")
 
@@ -61,10 +109,9 @@ def set_env_vars_unix(env_vars):
     else:
         profile_path = os.path.expanduser('~/.profile')
     
+    lines = ''.join(f'export {var}="{value}"\n' for var, value in env_vars.items())
     with open(profile_path, 'a') as profile:
-        profile.write('\n# Environment variables set by script\n')
-        for var, value in env_vars.items():
-            profile.write(f'export {var}="{value}"\n')
+        profile.write('\n# Environment variables set by script\n' + lines)
     
     print(f"Environment variables set permanently in {profile_path}.")
     print("Please restart your terminal or run 'source ~/.bashrc' (or the relevant file) to apply the changes.")
@@ -1,5 +1,4 @@
 from tts_wrapper import ElevenLabsTTS, ElevenLabsClient
-import json
 import time
 from pathlib import Path
 import os
@@ -14,8 +13,8 @@ tts = ElevenLabsTTS(client)
 try:
     ssml_text = tts.ssml.add(f"This is me speaking with Speak function and ElevenLabs")
     tts.speak_streamed(ssml_text)
-    # Pause after 5 seconds
-    time.sleep(0.3)
+    # Pause once the audio has started
+    tts.wait_state("playing", timeout=2)
     tts.pause_audio()
     print("Pausing..")
     # Resume after 3 seconds
@@ -29,7 +28,7 @@ try:
 except Exception as e:
     print(f"Error at pausing: {e}")
   
-time.sleep(3)
+tts.wait_state("idle", timeout=3)
 
 # Demonstrate saving audio to a file
 try:
@@ -40,8 +39,6 @@ try:
     print(f"Audio content saved to {output_file}")
 except Exception as e:
     print(f"Error at saving: {e}")
-
-time.sleep(3)  
       
 # Change voice and test again if possible
 try:
@@ -69,8 +66,7 @@ if len(voices) > 1:
         print(f"Error at setting voice: {e}")
     ssml_text_part2 = tts.ssml.add('Continuing with a new voice!')
     tts.speak_streamed(ssml_text_part2)
-
-time.sleep(3)
+    tts.drain(timeout=10)
 
 # ## calbacks
 
@@ -91,7 +87,7 @@ try:
 except Exception as e:
     print(f"Error at callbacks: {e}")
 
-time.sleep(3)
+tts.drain(timeout=10)
 
 # volume control test
 print("Volume setting is from 0-100")
@@ -103,7 +99,7 @@ try:
     text_with_prosody = tts.construct_prosody_tag(text_read)
     ssml_text = tts.ssml.add(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(0.5)
+    tts.drain(timeout=10)
     
     #clear ssml so the previous text is not repeated
     tts.ssml.clear_ssml()
@@ -113,7 +109,7 @@ try:
     text_with_prosody = tts.construct_prosody_tag(text_read)
     ssml_text = tts.ssml.add(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(0.5)
+    tts.drain(timeout=10)
 
     tts.ssml.clear_ssml()
     tts.set_property("volume", "10")
@@ -123,7 +119,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(0.5)
+    tts.drain(timeout=10)
 
 except Exception as e:
     print(f"Error at setting volume: {e}")
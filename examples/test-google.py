@@ -1,5 +1,4 @@
 from tts_wrapper import GoogleTTS, GoogleClient
-import json
 import time
 from pathlib import Path
 import os
@@ -15,8 +14,8 @@ tts = GoogleTTS(client)
 try:
     ssml_text = tts.ssml.add(f"This is me speaking with Speak function and google")
     tts.speak_streamed(ssml_text)
-    # Pause after 5 seconds
-    time.sleep(0.3)
+    # Pause once the audio has started
+    tts.wait_state("playing", timeout=2)
     tts.pause_audio()
     print("Pausing..")
     # Resume after 3 seconds
@@ -30,7 +29,7 @@ try:
 except Exception as e:
     print(f"Error at pausing: {e}")
   
-time.sleep(3)        
+tts.wait_state("idle", timeout=3)
 # Demonstrate saving audio to a file
 try:
     output_file = Path(f"output_google.mp3")
@@ -101,7 +100,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
     
     #clear ssml so the previous text is not repeated
     tts.ssml.clear_ssml()
@@ -112,7 +111,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
 
     tts.ssml.clear_ssml()
     tts.set_property("volume", "10")
@@ -121,7 +120,7 @@ try:
     text_with_prosody = tts.construct_prosody_tag(text_read)        
     ssml_text = tts.ssml.add(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
 
 except Exception as e:
     print(f"Error at setting volume: {e}")
@@ -139,7 +138,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
     
     #clear ssml so the previous text is not repeated
     tts.ssml.clear_ssml()
@@ -150,7 +149,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 
     tts.ssml.clear_ssml()
     tts.set_property("pitch", "x-low")
@@ -159,7 +158,7 @@ try:
     text_with_prosody = tts.construct_prosody_tag(text_read)        
     ssml_text = tts.ssml.add(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 except Exception as e:
     print(f"Error at setting pitch: {e}")   
 
@@ -176,7 +175,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
     
     #clear ssml so the previous text is not repeated
     tts.ssml.clear_ssml()
@@ -187,7 +186,7 @@ try:
     ssml_text = tts.ssml.add(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 
     tts.ssml.clear_ssml()
     tts.set_property("rate", "x-slow")
@@ -196,6 +195,6 @@ try:
     text_with_prosody = tts.construct_prosody_tag(text_read)        
     ssml_text = tts.ssml.add(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 except Exception as e:
     print(f"Error at setting pitch: {e}")  
\ No newline at end of file
@@ -1,9 +1,12 @@
 from tts_wrapper import MicrosoftTTS, MicrosoftClient
-import json
 import time
 from pathlib import Path
 import os
 from load_credentials import load_credentials
+
+# Log through a background thread and keep the Azure SDK's per-chunk debug output quiet
+MicrosoftTTS.configure_logging()
+
 # Load credentials
 load_credentials('credentials.json')
 client = MicrosoftClient(credentials=(os.getenv('MICROSOFT_TOKEN'), os.getenv('MICROSOFT_REGION')))
@@ -14,8 +17,8 @@ tts = MicrosoftTTS(client)
 try:
     ssml_text = tts.ssml.add(f"This is me speaking with Speak function and Microsoft")
     tts.speak_streamed(ssml_text)
-    # Pause after 5 seconds
-    time.sleep(0.3)
+    # Pause once the audio has started
+    tts.wait_state("playing", timeout=2)
     tts.pause_audio()
     print("Pausing..")
     # Resume after 3 seconds
@@ -95,30 +98,27 @@ try:
     print("Setting volume at 20")
     text_read = f"The current volume is at 20"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
     
-    #clear ssml so the previous text is not repeated
-    tts.ssml.clear_ssml()
     tts.set_property("volume", "100")
     print("Setting volume at 100")
     text_read = f"The current volume is at 100"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
 
-    tts.ssml.clear_ssml()
     tts.set_property("volume", "10")
     print("Setting volume at 10")
     text_read = f"The current volume is at 10"
     text_with_prosody = tts.construct_prosody_tag(text_read)        
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(3)
+    tts.drain(timeout=10)
 
 except Exception as e:
     print(f"Error at setting volume: {e}")
@@ -128,35 +128,31 @@ print("Pitch control is from x-low, low, medium, high, x-high")
 text_read = ""
 tts.set_property("volume", "70")
 try:
-    tts.ssml.clear_ssml()
     tts.set_property("pitch", "low")
     print("Setting pitch at low")
     text_read = f"The current pitch is LOW"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
     
-    #clear ssml so the previous text is not repeated
-    tts.ssml.clear_ssml()
     tts.set_property("pitch", "x-high")
     print("Setting pitch at EXTRA HIGH")
     text_read = f"The current pitch is at EXTRA HIGH"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 
-    tts.ssml.clear_ssml()
     tts.set_property("pitch", "x-low")
     print("Setting pitch at EXTRA LOW")
     text_read = f"The current pitch at EXTRA LOW"
     text_with_prosody = tts.construct_prosody_tag(text_read)        
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 except Exception as e:
     print(f"Error at setting pitch: {e}")   
 
@@ -165,34 +161,30 @@ print("Rate setting is from x-slow, slow, medium, fast, x-fast")
 text_read = ""
 tts.set_property("volume", "70")
 try:
-    tts.ssml.clear_ssml()
     tts.set_property("rate", "slow")
     print("Setting rate at SLOW")
     text_read = f"The current rate is SLOW"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
     
-    #clear ssml so the previous text is not repeated
-    tts.ssml.clear_ssml()
     tts.set_property("rate", "x-fast")
     print("Setting rate at EXTRA FAST")
     text_read = f"The current rate is at EXTRA FAST"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     print("ssml_test: ", ssml_text)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 
-    tts.ssml.clear_ssml()
     tts.set_property("rate", "x-slow")
     print("Setting rate at EXTRA SLOW")
     text_read = f"The current rate at EXTRA SLOW"
     text_with_prosody = tts.construct_prosody_tag(text_read)        
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=10)
 except Exception as e:
     print(f"Error at setting pitch: {e}")  
\ No newline at end of file
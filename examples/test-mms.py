@@ -1,5 +1,4 @@
 from tts_wrapper import MMSTTS, MMSClient
-import json
 import time
 from pathlib import Path
 import os
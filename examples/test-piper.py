@@ -1,5 +1,4 @@
 from tts_wrapper import PiperTTS, PiperClient
-import json
 
 
 def my_callback(word: str, start_time: float):
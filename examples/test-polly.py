@@ -1,13 +1,12 @@
 from tts_wrapper import PollyTTS, PollyClient
-import json
+import asyncio
 import time
 from pathlib import Path
-import os
 from load_credentials import load_credentials
 # Load credentials
-load_credentials('credentials.json')
+creds = load_credentials('credentials.json', services={'polly'})['Polly']
 
-client = PollyClient(credentials=(os.getenv('POLLY_REGION'),os.getenv('POLLY_AWS_KEY_ID'), os.getenv('POLLY_AWS_ACCESS_KEY')))
+client = PollyClient.get_shared(credentials=(creds.region, creds.aws_key_id, creds.aws_access_key))
 tts = PollyTTS(client)
 
 
@@ -15,8 +14,8 @@ tts = PollyTTS(client)
 try:
     ssml_text = tts.ssml.add(f"This is me speaking with Speak function and google")
     tts.speak_streamed(ssml_text)
-    # Pause after 5 seconds
-    time.sleep(0.3)
+    # Pause as soon as the audio has started
+    tts.first_audio_event.wait(timeout=2)
     tts.pause_audio()
     print("Pausing..")
     # Resume after 3 seconds
@@ -40,6 +39,13 @@ try:
     print(f"Audio content saved to {output_file}")
 except Exception as e:
     print(f"Error at saving: {e}")
+
+# Speak and save in one go, the file is written while the audio plays
+try:
+    asyncio.run(tts.speak_and_save_parallel(ssml_text, "polly_output.wav", "wav"))
+    print("Audio content saved to polly_output.wav")
+except Exception as e:
+    print(f"Error at speaking and saving: {e}")
   
       
 # Change voice and test again if possible
@@ -98,28 +104,25 @@ try:
     print("Setting volume at 50")
     text_read = f"The current volume is at 50"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=5)
     
-    #clear ssml so the previous text is not repeated
-    tts.ssml.clear_ssml()
     tts.set_property("volume", "100")
     print("Setting volume at 100")
     text_read = f"The current volume is at 100"
     text_with_prosody = tts.construct_prosody_tag(text_read)
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=5)
 
-    tts.ssml.clear_ssml()
     tts.set_property("volume", "10")
     print("Setting volume at 10")
     text_read = f"The current volume is at 10"
     text_with_prosody = tts.construct_prosody_tag(text_read)        
-    ssml_text = tts.ssml.add(text_with_prosody)
+    ssml_text = tts.ssml.build(text_with_prosody)
     tts.speak_streamed(ssml_text)
-    time.sleep(5)
+    tts.drain(timeout=5)
 
 except Exception as e:
     print(f"Error at setting volume: {e}")
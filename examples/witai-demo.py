@@ -1,5 +1,4 @@
 from tts_wrapper import WitAiTTS, WitAiClient
-import json
 import os 
 import os
 from load_credentials import load_credentials
@@ -1,23 +1,4 @@
-import os
-import sys
-import subprocess
 from setuptools import setup, find_packages
-from setuptools.command.install import install
-
-class CustomInstallCommand(install):
-    """Customized setuptools install command - installs system dependencies on Linux."""
-    
-    def run(self):
-        if os.name == 'posix' and sys.platform.startswith('linux'):
-            print("Installing system dependencies...")
-            commands = [
-                ["sudo", "apt-get", "update"],
-                ["sudo", "apt-get", "install", "-y", "portaudio19-dev"],
-                # Add other system dependencies here
-            ]
-            for command in commands:
-                subprocess.run(command, check=True)
-        install.run(self)
 
 setup(
     name='tts-wrapper',
@@ -42,7 +23,9 @@ setup(
         'piper': ['piper_tts>=1.2.0'],
         'mms': ['ttsmms>=0.7']
     },
-    cmdclass={
-        'install': CustomInstallCommand,
+    entry_points={
+        'console_scripts': [
+            'tts-wrapper-install-deps = tts_wrapper.install_dependencies:main',
+        ],
     },
 )
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Callable
 from unittest.mock import MagicMock
 
@@ -9,6 +10,7 @@ SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 TEST_DATA_DIR = os.path.join(SCRIPT_DIR, "data")
 
 
+@lru_cache(maxsize=1)
 def load_resp_wav():
     with open(os.path.join(TEST_DATA_DIR, "test.wav"), "rb") as f:
         return f.read()
@@ -19,12 +21,16 @@ class Helpers:
     def check_audio_file(path, format="wav"):
         assert os.path.exists(path), f"{path} does not exists"
         assert os.path.getsize(path) > 1024
-        assert filetype.guess_extension(path) == format
+        if format == "wav":
+            with open(path, "rb") as f:
+                head = f.read(12)
+            assert head[:4] == b"RIFF" and head[8:12] == b"WAVE"
+        else:
+            assert filetype.guess_extension(path) == format
 
     @staticmethod
     def create_tmp_filename(tmp_dir, filename):
-        if not os.path.exists(tmp_dir):
-            os.makedirs(tmp_dir)
+        os.makedirs(tmp_dir, exist_ok=True)
         return os.path.join(tmp_dir, filename)
 
 
@@ -40,8 +46,14 @@ def client():
     return client
 
 
+@lru_cache(maxsize=None)
+def _create_client(create_client):
+    return create_client()
+
+
 @pytest.fixture()
 def tts(tts_cls, client):
+    # client factories (which connect to the real services) are called once per session
     if isinstance(client, Callable) and not isinstance(client, MagicMock):
-        client = client()
+        client = _create_client(client)
     return tts_cls(client=client)
@@ -4,6 +4,14 @@ import pytest
 from tts_wrapper import UnsupportedFileFormat
 
 
+def requires_env(*names):
+    """Skips the online tests, without building a client, unless all of names are set."""
+    missing = [name for name in names if not os.environ.get(name)]
+    return pytest.mark.skipif(
+        bool(missing), reason=f"Skipping online tests as these are not set: {', '.join(missing)}."
+    )
+
+
 class BaseEngineTest:
     def test_synth_to_file(self, tts, helpers, formats, tmp_path):
         for format in formats:
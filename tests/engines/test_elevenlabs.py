@@ -0,0 +1,11 @@
+from unittest.mock import MagicMock
+
+from tts_wrapper import ElevenLabsTTS
+
+
+def test_volume_leaves_mp3_untouched():
+    client = MagicMock()
+    client.synth.return_value = b"ID3\x04\x00mp3 frames"
+    tts = ElevenLabsTTS(client=client)
+    tts.set_property("volume", "50")
+    assert tts.synth_to_bytes("hello", format="mp3") == b"ID3\x04\x00mp3 frames"
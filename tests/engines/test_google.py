@@ -3,7 +3,7 @@ import os
 import pytest
 from tts_wrapper import GoogleClient, GoogleTTS
 
-from . import BaseEngineTest
+from . import BaseEngineTest, requires_env
 
 
 def create_client():
@@ -16,6 +16,7 @@ class TestGoogleOffline(BaseEngineTest):
 
 
 @pytest.mark.slow
+@requires_env("GOOGLE_SA_PATH")
 @pytest.mark.parametrize(
     "formats,tts_cls,client",
     [(GoogleTTS.supported_formats(), GoogleTTS, create_client)],
@@ -3,7 +3,7 @@ import os
 import pytest
 from tts_wrapper import MicrosoftClient, MicrosoftTTS
 
-from . import BaseEngineTest
+from . import BaseEngineTest, requires_env
 
 
 def create_client():
@@ -17,6 +17,7 @@ class TestMicrosoftOffline(BaseEngineTest):
 
 
 @pytest.mark.slow
+@requires_env("MICROSOFT_KEY")
 @pytest.mark.parametrize(
     "formats,tts_cls,client",
     [(MicrosoftTTS.supported_formats(), MicrosoftTTS, create_client)],
@@ -3,14 +3,14 @@ import os
 import pytest
 from tts_wrapper import PollyClient, PollyTTS
 
-from . import BaseEngineTest
+from . import BaseEngineTest, requires_env
 
 
 def create_client():
     POLLY_REGION = os.environ.get("POLLY_REGION")
     POLLY_AWS_ID = os.environ.get("POLLY_AWS_ID")
     POLLY_AWS_KEY = os.environ.get("POLLY_AWS_KEY")
-    return PollyClient((POLLY_REGION, POLLY_AWS_ID, POLLY_AWS_KEY))
+    return PollyClient.get_shared((POLLY_REGION, POLLY_AWS_ID, POLLY_AWS_KEY))
 
 
 @pytest.mark.parametrize("formats,tts_cls", [(["wav"], PollyTTS)])
@@ -19,6 +19,7 @@ class TestPollyOffline(BaseEngineTest):
 
 
 @pytest.mark.slow
+@requires_env("POLLY_REGION", "POLLY_AWS_ID", "POLLY_AWS_KEY")
 @pytest.mark.parametrize(
     "formats,tts_cls,client", [(PollyTTS.supported_formats(), PollyTTS, create_client)]
 )
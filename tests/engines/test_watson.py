@@ -3,7 +3,7 @@ import os
 import pytest
 from tts_wrapper import WatsonClient, WatsonTTS
 
-from . import BaseEngineTest
+from . import BaseEngineTest, requires_env
 
 
 def create_client():
@@ -18,6 +18,7 @@ class TestWatsonOffline(BaseEngineTest):
 
 
 @pytest.mark.slow
+@requires_env("WATSON_API_KEY", "WATSON_API_URL")
 @pytest.mark.parametrize(
     "formats,tts_cls,client",
     [(WatsonTTS.supported_formats(), WatsonTTS, create_client)],
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+import tts_wrapper
+
+
+def test_importing_package_does_not_import_engines():
+    code = "import sys, tts_wrapper; print('tts_wrapper.engines.polly' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_engine_classes_are_loaded_on_access():
+    from tts_wrapper.engines.polly import PollyTTS
+
+    assert tts_wrapper.PollyTTS is PollyTTS
+    assert "PollyTTS" in dir(tts_wrapper)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        tts_wrapper.NoSuchTTS
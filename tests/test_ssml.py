@@ -1,4 +1,4 @@
-from tts_wrapper import SSMLNode
+from tts_wrapper import BaseSSMLRoot, SSMLNode
 
 
 def test_simple_tag():
@@ -33,3 +33,33 @@ def test_render_multiple_children():
         str(SSMLNode("speak", children=children))
         == '<speak>Hello, <break time="3s"></break> World!</speak>'
     )
+
+
+def test_build_does_not_change_node():
+    node = SSMLNode("speak").add("hello")
+    assert node.build("world") == "<speak>world</speak>"
+    assert str(node) == "<speak>hello</speak>"
+
+
+def test_root_build():
+    root = BaseSSMLRoot()
+    root.add("hello")
+    assert root.build("world") == "<speak>world</speak>"
+    assert str(root) == "<speak>hello</speak>"
+
+
+def test_root_build_nested_inner():
+    root = BaseSSMLRoot()
+    root._inner = SSMLNode("voice", {"name": "a"})
+    root._root = SSMLNode("speak", children=[root._inner])
+    assert root.build("hi") == '<speak><voice name="a">hi</voice></speak>'
+
+
+def test_compile_template():
+    root = BaseSSMLRoot()
+    root._inner = SSMLNode("voice", {"name": "a"})
+    root._root = SSMLNode("speak", children=[root._inner])
+    template = root.compile_template()
+    assert template.render("hi") == '<speak><voice name="a">hi</voice></speak>'
+    assert template.render("a < b & c") == '<speak><voice name="a">a &lt; b &amp; c</voice></speak>'
+
@@ -0,0 +1,70 @@
+from tts_wrapper._synth_cache import SynthCache, cached_synth, synth_cache
+
+
+class FakeTTS:
+    def __init__(self, client):
+        self._client = client
+        self.voice_id = "voice"
+        self.timings = []
+
+    def get_property(self, name):
+        return ""
+
+    def set_timings(self, timings):
+        self.timings = timings
+
+    @cached_synth
+    def synth_to_bytes(self, text, format="wav"):
+        return f"{self._client}:{text}".encode()
+
+
+def test_get_returns_stored_entry():
+    cache = SynthCache()
+    cache.put("a", b"audio", [(0.0, "hello")])
+    assert cache.get("a") == (b"audio", [(0.0, "hello")])
+    assert cache.get("b") is None
+    assert cache.stats() == {"entries": 1, "bytes": 5, "hits": 1, "misses": 1}
+
+
+def test_evicts_least_recently_used():
+    cache = SynthCache(max_entries=2)
+    cache.put("a", b"1", [])
+    cache.put("b", b"2", [])
+    cache.get("a")
+    cache.put("c", b"3", [])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_evicts_over_max_bytes():
+    cache = SynthCache(max_bytes=4)
+    cache.put("a", b"12", [])
+    cache.put("b", b"345", [])
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 3
+
+
+def test_clear():
+    cache = SynthCache()
+    cache.put("a", b"1", [])
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cached_synth_is_off_by_default():
+    assert synth_cache.max_entries == 0
+    FakeTTS("model").synth_to_bytes("hello")
+    assert synth_cache.stats()["entries"] == 0
+
+
+def test_cached_synth_keys_on_client():
+    synth_cache.max_entries = 10
+    try:
+        assert FakeTTS("model a").synth_to_bytes("hello") == b"model a:hello"
+        assert FakeTTS("model b").synth_to_bytes("hello") == b"model b:hello"
+        assert FakeTTS("model a").synth_to_bytes("hello") == b"model a:hello"
+        assert synth_cache.stats()["hits"] == 1
+    finally:
+        synth_cache.max_entries = 0
+        synth_cache.clear()
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+from tts_wrapper.tts import AbstractTTS, PreRollBuffer, WordDispatcher, _build_prosody, _prosody_opening_tag, _word_table
+
+
+def test_build_prosody_all_properties():
+    assert (
+        _build_prosody("fast", "high", "50", "hello")
+        == '<prosody rate="fast" pitch="high" volume="50">hello</prosody>'
+    )
+
+
+def test_build_prosody_skips_empty_properties():
+    assert _build_prosody("", "", "20", "hello") == '<prosody volume="20">hello</prosody>'
+
+
+def test_prosody_tag_is_built_once_per_setting():
+    _prosody_opening_tag.cache_clear()
+    _build_prosody("", "", "20", "hello")
+    _build_prosody("", "", "20", "world")
+    assert _prosody_opening_tag.cache_info().hits == 1
+
+
+def test_preroll_buffer_waits_for_preroll():
+    buffer = PreRollBuffer(preroll_bytes=8)
+    buffer.push(b"\x01\x01" * 2)
+    assert buffer.pop(4) == b"\x00" * 4
+    buffer.push(b"\x02\x02" * 2)
+    assert buffer.pop(4) == b"\x01\x01" * 2
+    assert buffer.position == 4
+
+
+def test_preroll_buffer_pads_underrun_and_plays_out_on_finish():
+    buffer = PreRollBuffer(preroll_bytes=2)
+    buffer.push(b"\x01\x01\x01")
+    assert buffer.pop(6) == b"\x01\x01" + b"\x00" * 4
+    buffer.finish()
+    assert buffer.pop(6) == b"\x01"
+    assert buffer.finished
+
+
+class FileTTS(AbstractTTS):
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+        # synth_many(concurrency=2) must let two workers in at once to get past it
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    @classmethod
+    def supported_formats(cls):
+        return ["wav"]
+
+    def get_voices(self):
+        return []
+
+    def synth_to_bytes(self, text, format="wav"):
+        return b""
+
+    def synth_to_file(self, text, filename, format=None):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        self.barrier.wait()
+        with open(filename, "w") as f:
+            f.write(text)
+        with self.lock:
+            self.running -= 1
+
+
+def test_synth_many_limits_concurrency(tmp_path):
+    tts = FileTTS()
+    items = [(f"text {i}", str(tmp_path / f"{i}.wav")) for i in range(6)]
+    asyncio.run(tts.synth_many(items, concurrency=2))
+    assert tts.most_running == 2
+    assert (tmp_path / "5.wav").read_text() == "text 5"
+
+
+def test_construct_prosody_tag_leaves_text_alone_without_ssml_support():
+    tts = FileTTS()
+    tts.set_property("rate", "fast")
+    assert tts.construct_prosody_tag("hello") == '<prosody rate="fast">hello</prosody>'
+    tts.supports_ssml = False
+    assert tts.construct_prosody_tag("hello") == "hello"
+
+
+def test_word_table_groups_close_words():
+    table = _word_table([(0.5, "world"), (0.0, "hello"), (0.01, "there")])
+    assert table == [
+        (0.0, [("hello", 0.0, 0.01), ("there", 0.01, 0.5)]),
+        (0.5, [("world", 0.5, 0.5)]),
+    ]
+
+
+def test_word_dispatcher_dispatches_in_order_and_cancels():
+    batches = []
+    got_b = threading.Event()
+
+    def dispatch(batch):
+        batches.append(batch)
+        if batch[0][0] == "b":
+            got_b.set()
+
+    # the clock stands still 1s in, so "a" and "b" are due and "c" is 4s away
+    dispatcher = WordDispatcher(_word_table([(0.0, "a"), (0.05, "b"), (5.0, "c")]), dispatch,
+                                start_time=0.0, clock=lambda: 1.0)
+    dispatcher.start()
+    assert got_b.wait(timeout=5)
+    dispatcher.cancel()
+    dispatcher.join(timeout=1)
+    assert not dispatcher.is_alive()
+    assert [[word for word, _, _ in batch] for batch in batches] == [["a"], ["b"]]
+
@@ -0,0 +1,70 @@
+import array
+import io
+import os
+import wave
+
+import pytest
+
+from tts_wrapper.engines.utils import (
+    adjust_volume,
+    process_wav,
+    split_sentences,
+    strip_wav_header,
+    wav_header,
+    write_audio_file,
+)
+
+
+def test_split_sentences():
+    assert split_sentences("This is the first one. And here is the second! Is this third?") == [
+        "This is the first one.",
+        "And here is the second!",
+        "Is this third?",
+    ]
+
+
+def test_split_sentences_keeps_abbreviations_and_decimals():
+    text = "Dr. Smith paid 3.50 dollars for it. Then he left."
+    assert split_sentences(text) == ["Dr. Smith paid 3.50 dollars for it.", "Then he left."]
+
+
+def test_split_sentences_joins_short_sentences():
+    assert split_sentences("Hi. This is a longer sentence.") == ["Hi. This is a longer sentence."]
+
+
+def test_strip_wav_header():
+    assert strip_wav_header(process_wav(b"\x01\x02" * 10)) == b"\x01\x02" * 10
+
+
+def test_strip_wav_header_without_header():
+    assert strip_wav_header(b"\x01\x02" * 10) == b"\x01\x02" * 10
+
+
+def test_adjust_volume():
+    pytest.importorskip("numpy")
+    pcm = array.array("h", [1000, -1000, 30000]).tobytes()
+    assert array.array("h", adjust_volume(pcm, 50)).tolist() == [500, -500, 15000]
+
+
+def test_adjust_volume_clips():
+    pytest.importorskip("numpy")
+    pcm = array.array("h", [30000, -30000]).tobytes()
+    assert array.array("h", adjust_volume(pcm, 200)).tolist() == [32767, -32768]
+
+
+def test_wav_header_matches_wave_module():
+    bio = io.BytesIO()
+    with wave.open(bio, "wb") as wav:
+        wav.setparams((1, 2, 22050, 0, "NONE", "NONE"))
+        wav.writeframes(b"\x01\x02" * 10)
+    assert wav_header(20, 22050) + b"\x01\x02" * 10 == bio.getvalue()
+
+
+def test_write_audio_file_replaces_atomically(tmp_path):
+    filename = str(tmp_path / "audio.wav")
+    write_audio_file(filename, b"old")
+    write_audio_file(filename, b"RIFF", b"new")
+
+    with open(filename, "rb") as f:
+        assert f.read() == b"RIFFnew"
+    assert os.listdir(tmp_path) == ["audio.wav"]
@@ -0,0 +1,21 @@
+from tts_wrapper._voice_cache import VoiceCache
+
+
+def test_reuses_voices_from_file(tmp_path):
+    path = str(tmp_path / "voices.json")
+    voices = [{"id": "a"}]
+    assert VoiceCache(path).get_voices("engine", lambda: voices) == voices
+    assert VoiceCache(path).get_voices("engine", lambda: []) == voices
+
+
+def test_refetches_when_stale(tmp_path):
+    path = str(tmp_path / "voices.json")
+    VoiceCache(path).get_voices("engine", lambda: [{"id": "a"}])
+    assert VoiceCache(path, ttl=0).get_voices("engine", lambda: [{"id": "b"}]) == [{"id": "b"}]
+
+
+def test_clear(tmp_path):
+    cache = VoiceCache(str(tmp_path / "voices.json"))
+    cache.get_voices("engine", lambda: [{"id": "a"}])
+    cache.clear()
+    assert cache.get_voices("engine", lambda: [{"id": "b"}]) == [{"id": "b"}]
@@ -1,4 +1,17 @@
 from .exceptions import *
 from .ssml import *
 from .tts import *
-from .engines import *
+from . import engines
+
+
+def __getattr__(name):
+    # engine classes are loaded on first access, see engines/__init__.py
+    if name not in engines._LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(engines, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(engines._LAZY))
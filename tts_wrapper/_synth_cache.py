@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+CacheEntry = Tuple[bytes, List[Any]]
+
+
+class SynthCache:
+    """Thread-safe LRU cache of synthesized audio and its word timings.
+
+    Entries are evicted least recently used first once there are more than
+    max_entries of them, or once the cached audio takes up more than max_bytes.
+    Setting max_entries to 0 turns caching off.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: Hashable, audio: bytes, timings: List[Any]) -> None:
+        if self.max_entries <= 0 or len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = (audio, list(timings))
+            self._size += len(audio)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# off until max_entries is raised, e.g. tts.cache.max_entries = 1000
+synth_cache = SynthCache(max_entries=0)
+
+
+def cached_synth(synth_to_bytes: Callable) -> Callable:
+    """Wraps an engine's synth_to_bytes so repeated requests are served from synth_cache.
+
+    The key covers everything that changes the output: engine, client (which holds the
+    model, credentials and region), voice, language, text, format and the
+    rate/volume/pitch properties. A hit restores the word timings the engine set when
+    the audio was first synthesized. Does nothing while the cache is turned off.
+    """
+    if getattr(synth_to_bytes, "_synth_cached", False):
+        return synth_to_bytes
+
+    @wraps(synth_to_bytes)
+    def wrapper(self, text: Any, format: Optional[str] = "wav") -> bytes:
+        if synth_cache.max_entries <= 0:
+            return synth_to_bytes(self, text, format)
+        key = (
+            self.__class__.__name__,
+            # the client itself rather than its id, which could be reused once it is freed
+            getattr(self, "_client", None),
+            getattr(self, "_voice", self.voice_id),
+            getattr(self, "_lang", None),
+            str(text),
+            format,
+            self.get_property("rate"),
+            self.get_property("volume"),
+            self.get_property("pitch"),
+        )
+        entry = synth_cache.get(key)
+        if entry is not None:
+            audio, timings = entry
+            self.set_timings(list(timings))
+            return audio
+        audio = synth_to_bytes(self, text, format)
+        if isinstance(audio, (bytes, bytearray)):
+            synth_cache.put(key, bytes(audio), self.timings)
+        return audio
+
+    wrapper._synth_cached = True  # type: ignore[attr-defined]
+    return wrapper
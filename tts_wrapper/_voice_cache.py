@@ -0,0 +1,83 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+Voices = List[Dict[str, Any]]
+
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def default_cache_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "tts-wrapper", "voices.json")
+
+
+class VoiceCache:
+    """Keeps the voice lists returned by the engines, in memory and in a JSON file.
+
+    Voice lists rarely change, so a list fetched less than ttl seconds ago is reused,
+    also by later runs. The file holds {key: {"fetched_at": ..., "voices": [...]}}.
+    Failing to read or write the file only means the cache is skipped.
+
+    @param path: JSON file to use, defaults to ~/.cache/tts-wrapper/voices.json
+    @param ttl: seconds before a cached list is fetched again
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL) -> None:
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.debug("Could not write voice cache %s: %s", self.path, e)
+
+    def get_voices(self, key: str, fetch: Callable[[], Voices]) -> Voices:
+        """Returns the cached voices for key, calling fetch if there are none or they are stale.
+
+        @param key: name of the engine (and anything else the list depends on)
+        @param fetch: function returning the voices from the service
+        @returns: list of voices
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None and time.time() - entry["fetched_at"] < self.ttl:
+                return entry["voices"]
+
+        voices = fetch()
+        if voices:
+            with self._lock:
+                self._load()[key] = {"fetched_at": time.time(), "voices": voices}
+                self._save()
+        return voices
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Forgets the cached voices for key, or for every engine if no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries = {}
+            else:
+                self._load().pop(key, None)
+            self._save()
+
+
+voice_cache = VoiceCache()
@@ -1,13 +1,32 @@
+import importlib
 import sys
-from .google import *
-from .microsoft import *
-from .pico import *
-from .polly import *
-from .sapi import *
-from .watson import *
-from .elevenlabs import *
-from .uwp import *
-from .witai import *
-from .mms import *
+
+# The engines are imported on first use, so that importing one of them doesn't
+# pull in the SDKs of all the others.
+_LAZY = {
+    "GoogleClient": ".google", "GoogleSSML": ".google", "GoogleTTS": ".google",
+    "MicrosoftClient": ".microsoft", "MicrosoftSSML": ".microsoft", "MicrosoftTTS": ".microsoft",
+    "PicoClient": ".pico", "PicoTTS": ".pico",
+    "PollyClient": ".polly", "PollySSML": ".polly", "PollyTTS": ".polly",
+    "SAPIClient": ".sapi", "SAPITTS": ".sapi",
+    "WatsonClient": ".watson", "WatsonSSML": ".watson", "WatsonTTS": ".watson",
+    "ElevenLabsClient": ".elevenlabs", "ElevenLabsSSMLNode": ".elevenlabs",
+    "ElevenLabsSSMLRoot": ".elevenlabs", "ElevenLabsTTS": ".elevenlabs",
+    "UWPClient": ".uwp", "UWPSSML": ".uwp", "UWPTTS": ".uwp",
+    "WitAiClient": ".witai", "WitAiSSML": ".witai", "WitAiTTS": ".witai",
+    "MMSClient": ".mms", "MMSSSML": ".mms", "MMSTTS": ".mms",
+}
 if sys.platform == "linux":
-    from .piper import *
+    _LAZY.update({"PiperClient": ".piper", "PiperSSML": ".piper", "PiperTTS": ".piper"})
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,6 +1,8 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import time
+
 from ...tts import FileFormat
-import requests
+from ...http import shared_session
 from ...exceptions import ModuleNotInstalled
 from ...exceptions import UnsupportedFileFormat
 
@@ -10,12 +12,91 @@ FORMATS = {
     "mp3": "mp3_22050_32",
 }
 
+# get_voices reuses the API's voice list for this many seconds
+VOICES_CACHE_TTL = 60
+
+ACCENT_TO_LANGUAGE_CODE = {
+    'american': 'en-US',
+    'british': 'en-GB',
+    'british-essex': 'en-GB',
+    'american-southern': 'en-US',
+    'australian': 'en-AU',
+    'irish': 'en-IE',
+    'english-italian': 'en-IT',
+    'english-swedish': 'en-SE',
+    'american-irish': 'en-IE-US',
+    'chinese': 'zh-CN',
+    'korean': 'ko-KR',
+    'dutch': 'nl-NL',
+    'turkish': 'tr-TR',
+    'swedish': 'sv-SE',
+    'indonesian': 'id-ID',
+    'filipino': 'fil-PH',
+    'japanese': 'ja-JP',
+    'ukrainian': 'uk-UA',
+    'greek': 'el-GR',
+    'czech': 'cs-CZ',
+    'finnish': 'fi-FI',
+    'romanian': 'ro-RO',
+    'danish': 'da-DK',
+    'bulgarian': 'bg-BG',
+    'malay': 'ms-MY',
+    'slovak': 'sk-SK',
+    'croatian': 'hr-HR',
+    'classic-arabic': 'ar-SA',
+    'tamil': 'ta-IN'
+}
+
+SUPPORTED_LANGUAGES_V1 = {
+    'en-US': 'English',
+    'pl-PL': 'Polish',
+    'de-DE': 'German',
+    'es-ES': 'Spanish',
+    'fr-FR': 'French',
+    'it-IT': 'Italian',
+    'hi-IN': 'Hindi',
+    'pt-BR': 'Portuguese'
+}
+
+SUPPORTED_LANGUAGES_V2 = {
+    'en-US': 'English',
+    'pl-PL': 'Polish',
+    'de-DE': 'German',
+    'es-ES': 'Spanish',
+    'fr-FR': 'French',
+    'it-IT': 'Italian',
+    'hi-IN': 'Hindi',
+    'pt-BR': 'Portuguese',
+    'zh-CN': 'Chinese',
+    'ko-KR': 'Korean',
+    'nl-NL': 'Dutch',
+    'tr-TR': 'Turkish',
+    'sv-SE': 'Swedish',
+    'id-ID': 'Indonesian',
+    'fil-PH': 'Filipino',
+    'ja-JP': 'Japanese',
+    'uk-UA': 'Ukrainian',
+    'el-GR': 'Greek',
+    'cs-CZ': 'Czech',
+    'fi-FI': 'Finnish',
+    'ro-RO': 'Romanian',
+    'da-DK': 'Danish',
+    'bg-BG': 'Bulgarian',
+    'ms-MY': 'Malay',
+    'sk-SK': 'Slovak',
+    'hr-HR': 'Croatian',
+    'ar-SA': 'Classic Arabic',
+    'ta-IN': 'Tamil'
+}
+
+
 class ElevenLabsClient:
     def __init__(self, credentials):
         if not credentials:
             raise ValueError("An API key for ElevenLabs must be provided")
         self.api_key = credentials
         self.base_url = "https://api.elevenlabs.io"
+        self._voices_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
     def synth(self, text: str, voice_id: str, format: FileFormat) -> bytes:
         url = f"{self.base_url}/v1/text-to-speech/{voice_id}"
@@ -33,7 +114,7 @@ class ElevenLabsClient:
                 'similarity_boost': 0.5
             }
         }
-        response = requests.post(url, headers=headers, json=data, params=params)
+        response = shared_session().post(url, headers=headers, json=data, params=params)
         if response.status_code == 200:
             return response.content
         else:
@@ -52,95 +133,30 @@ class ElevenLabsClient:
             raise Exception(error_message)
 
 
-    def get_voices(self):
+    def _get_voices_raw(self) -> List[Dict[str, Any]]:
+        """Returns the voices listed by the API, reusing the last response for VOICES_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if self._voices_cache is not None and now - self._voices_cache[0] < VOICES_CACHE_TTL:
+            return self._voices_cache[1]
         url = f"{self.base_url}/v1/voices"
-        response = requests.get(url)
-        if response.ok:
-            voices_data = response.json()
-            voices = voices_data['voices']
-            standardized_voices = []
-            accent_to_language_code = {
-                'american': 'en-US',
-                'british': 'en-GB',
-                'british-essex': 'en-GB',
-                'american-southern': 'en-US',
-                'australian': 'en-AU',
-                'irish': 'en-IE',
-                'english-italian': 'en-IT',
-                'english-swedish': 'en-SE',
-                'american-irish': 'en-IE-US',
-                'chinese': 'zh-CN',
-                'korean': 'ko-KR',
-                'dutch': 'nl-NL',
-                'turkish': 'tr-TR',
-                'swedish': 'sv-SE',
-                'indonesian': 'id-ID',
-                'filipino': 'fil-PH',
-                'japanese': 'ja-JP',
-                'ukrainian': 'uk-UA',
-                'greek': 'el-GR',
-                'czech': 'cs-CZ',
-                'finnish': 'fi-FI',
-                'romanian': 'ro-RO',
-                'danish': 'da-DK',
-                'bulgarian': 'bg-BG',
-                'malay': 'ms-MY',
-                'slovak': 'sk-SK',
-                'croatian': 'hr-HR',
-                'classic-arabic': 'ar-SA',
-                'tamil': 'ta-IN'
-            }
-            supported_languages_v1 = {
-                'en-US': 'English',
-                'pl-PL': 'Polish',
-                'de-DE': 'German',
-                'es-ES': 'Spanish',
-                'fr-FR': 'French',
-                'it-IT': 'Italian',
-                'hi-IN': 'Hindi',
-                'pt-BR': 'Portuguese'
-            }
-            supported_languages_v2 = {
-                'en-US': 'English',
-                'pl-PL': 'Polish',
-                'de-DE': 'German',
-                'es-ES': 'Spanish',
-                'fr-FR': 'French',
-                'it-IT': 'Italian',
-                'hi-IN': 'Hindi',
-                'pt-BR': 'Portuguese',
-                'zh-CN': 'Chinese',
-                'ko-KR': 'Korean',
-                'nl-NL': 'Dutch',
-                'tr-TR': 'Turkish',
-                'sv-SE': 'Swedish',
-                'id-ID': 'Indonesian',
-                'fil-PH': 'Filipino',
-                'ja-JP': 'Japanese',
-                'uk-UA': 'Ukrainian',
-                'el-GR': 'Greek',
-                'cs-CZ': 'Czech',
-                'fi-FI': 'Finnish',
-                'ro-RO': 'Romanian',
-                'da-DK': 'Danish',
-                'bg-BG': 'Bulgarian',
-                'ms-MY': 'Malay',
-                'sk-SK': 'Slovak',
-                'hr-HR': 'Croatian',
-                'ar-SA': 'Classic Arabic',
-                'ta-IN': 'Tamil'
-            }
-            for voice in voices:
-                voice['id'] = voice['voice_id']
-                accent = voice['labels'].get('accent', 'american')
-                language_code = accent_to_language_code.get(accent, 'en-US')  # Default to 'en-US'
-                if voice['high_quality_base_model_ids'] == 'eleven_multilingual_v1':
-                    voice['language_codes'] = [language_code for language_code in supported_languages_v1.keys()]
-                else:
-                    voice['language_codes'] = [language_code for language_code in supported_languages_v2.keys()]
-                voice['name'] = voice['name']
-                voice['gender'] = 'Unknown'
-                standardized_voices.append(voice)
-            return standardized_voices
-        else:
-            response.raise_for_status()
+        response = shared_session().get(url)
+        response.raise_for_status()
+        voices = response.json()['voices']
+        self._voices_cache = (now, voices)
+        return voices
+
+    def get_voices(self):
+        standardized_voices = []
+        for raw_voice in self._get_voices_raw():
+            voice = dict(raw_voice)
+            voice['id'] = voice['voice_id']
+            accent = voice['labels'].get('accent', 'american')
+            language_code = ACCENT_TO_LANGUAGE_CODE.get(accent, 'en-US')  # Default to 'en-US'
+            if voice['high_quality_base_model_ids'] == 'eleven_multilingual_v1':
+                voice['language_codes'] = list(SUPPORTED_LANGUAGES_V1.keys())
+            else:
+                voice['language_codes'] = list(SUPPORTED_LANGUAGES_V2.keys())
+            voice['name'] = voice['name']
+            voice['gender'] = 'Unknown'
+            standardized_voices.append(voice)
+        return standardized_voices
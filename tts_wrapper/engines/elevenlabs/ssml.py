@@ -1,9 +1,9 @@
 from ...ssml import BaseSSMLRoot, SSMLNode, Child
 
 class ElevenLabsSSMLNode(SSMLNode):
-    def __str__(self) -> str:
+    def _render(self, children) -> str:
         # Override to generate only the inner content without the actual SSML tags
-        rendered_children = "".join(str(c) for c in self._children)
+        rendered_children = "".join(str(c) for c in children)
         return rendered_children
 
 class ElevenLabsSSMLRoot(BaseSSMLRoot):
@@ -14,6 +14,9 @@ class ElevenLabsSSMLRoot(BaseSSMLRoot):
     def __str__(self) -> str:
         # Use the overridden __str__ method of ElevenLabsSSMLNode
         return str(self._inner)
+
+    def build(self, child: Child) -> str:
+        return self._inner.build(child)
         
     def clear_ssml(self):
         self._inner.clear_ssml()
\ No newline at end of file
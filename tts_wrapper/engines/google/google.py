@@ -1,7 +1,7 @@
 from typing import Any, List, Dict, Optional
 
 from ...exceptions import UnsupportedFileFormat
-from ...tts import AbstractTTS, FileFormat
+from ...tts import AbstractTTS, FileFormat, _build_prosody
 from . import GoogleClient, GoogleSSML
 
 
@@ -36,25 +36,9 @@ class GoogleTTS(AbstractTTS):
         return self._client.get_voices()
 
     def construct_prosody_tag(self, text:str ) -> str:
-        properties = []
-        rate = self.get_property("rate")
-        if rate != "":            
-            properties.append(f'rate="{rate}"')
-        
-        pitch = self.get_property("pitch")
-        if pitch != "":
-            properties.append(f'pitch="{pitch}"')
-    
         volume_in_number = self.get_property("volume")
-        if volume_in_number != "":
-            volume_in_words = self.mapped_to_predefined_word(volume_in_number)
-            properties.append(f'volume="{volume_in_words}"')
-        
-        prosody_content = " ".join(properties)
-        
-        text_with_tag = f'<prosody {prosody_content}>{text}</prosody>'
-        
-        return text_with_tag
+        volume_in_words = self.mapped_to_predefined_word(volume_in_number) if volume_in_number != "" else ""
+        return _build_prosody(self.get_property("rate"), self.get_property("pitch"), volume_in_words, text)
 
     def mapped_to_predefined_word(self, volume: str) -> str:
         volume_in_float = float(volume)
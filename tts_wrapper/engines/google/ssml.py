@@ -27,5 +27,9 @@ class GoogleSSML(BaseSSMLRoot):
         ssml_parts.append("</speak>")
         return "".join(ssml_parts)
 
+    def build(self, text: str) -> str:
+        # add doesn't keep any state here, so it already builds a standalone document
+        return self.add(text)
+
     def clear_ssml(self):
         self._inner.clear_ssml()
\ No newline at end of file
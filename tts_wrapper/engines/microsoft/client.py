@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple, List, Dict, Any, Optional
 from tts_wrapper.tts import FileFormat
 
@@ -8,10 +9,19 @@ try:
 except ImportError:
     requests = None  # type: ignore
 
-try:
-    import azure.cognitiveservices.speech as speechsdk
-except ImportError:
-    speechsdk = None  # type: ignore
+
+@lru_cache(maxsize=1)
+def _speechsdk():
+    """Imports the Azure Speech SDK the first time it is needed, returning None if it is not installed.
+
+    Loading the SDK's native library is slow, so it is put off until a client is created
+    and the outcome is remembered. Call _speechsdk.cache_clear() to probe again.
+    """
+    try:
+        import azure.cognitiveservices.speech as speechsdk
+    except ImportError:
+        return None
+    return speechsdk
 
 
 Credentials = Tuple[str, Optional[str]]
@@ -25,6 +35,7 @@ class MicrosoftClient:
         self,
         credentials: Optional[Credentials] = None,
     ) -> None:
+        speechsdk = _speechsdk()
         if speechsdk is None:
             raise ModuleNotInstalled("speechsdk")
 
@@ -39,6 +50,7 @@ class MicrosoftClient:
 
     def get_available_voices(self) -> List[Dict[str, Any]]:
         """Fetches available voices from Microsoft Azure TTS service."""
+        speechsdk = _speechsdk()
         speech_synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config, audio_config=None)
         result = speech_synthesizer.get_voices_async().get()
         # Check the result
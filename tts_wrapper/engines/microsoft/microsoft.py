@@ -4,9 +4,8 @@ from typing import Any, List,Dict, Optional
 from ...exceptions import UnsupportedFileFormat
 from ...tts import AbstractTTS, FileFormat
 from . import MicrosoftClient, MicrosoftSSML
+from .client import _speechsdk
 
-from azure.cognitiveservices.speech import SpeechConfig, SpeechSynthesizer, AudioConfig
-import azure.cognitiveservices.speech as speechsdk
 import logging
 
 class MicrosoftTTS(AbstractTTS):
@@ -15,6 +14,7 @@ class MicrosoftTTS(AbstractTTS):
         self._client = client
         self.set_voice(voice or "en-US-JessaNeural", lang or "en-US")
         self._ssml = MicrosoftSSML(self._lang,self._voice) 
+        speechsdk = _speechsdk()
         audio_config = speechsdk.audio.AudioOutputConfig(use_default_speaker=True)
         self.synthesizer = speechsdk.SpeechSynthesizer(
             speech_config=self._client.speech_config,
@@ -28,15 +28,16 @@ class MicrosoftTTS(AbstractTTS):
     def speak(self, ssml: str, format: Optional[FileFormat] = "wav"):
         if not self._is_ssml(str(ssml)):
             ssml = self.ssml.add(str(ssml))
+        speechsdk = _speechsdk()
         format = self._client.FORMATS.get(format, "Riff24Khz16BitMonoPcm")
         self._client.speech_config.set_speech_synthesis_output_format(getattr(speechsdk.SpeechSynthesisOutputFormat, format))
 
         result = self.synthesizer.speak_ssml_async(str(ssml)).get()
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            logging.info("Speech synthesized for text [{}]".format(ssml))
+            logging.info("Speech synthesized for text [%s]", ssml)
         elif result.reason == speechsdk.ResultReason.Canceled:
             cancellation_details = result.cancellation_details
-            logging.info("Speech synthesis canceled: {}".format(cancellation_details.reason))
+            logging.info("Speech synthesis canceled: %s", cancellation_details.reason)
             if cancellation_details.reason == speechsdk.CancellationReason.Error:
                 logging.error("Error details: {}".format(cancellation_details.error_details))
 
@@ -46,7 +47,9 @@ class MicrosoftTTS(AbstractTTS):
         return MicrosoftSSML(self._lang, self._voice)
 
     def get_voices(self) -> List[Dict[str, Any]]:
-        return self._client.get_available_voices()
+        # the voices on offer differ between Azure regions
+        key = f"{self.__class__.__name__}:{self._client._subscription_region}"
+        return self.voice_cache.get_voices(key, self._client.get_available_voices)
 
     def set_voice(self, voice_id: str, lang_id: str):
         """
@@ -60,27 +63,8 @@ class MicrosoftTTS(AbstractTTS):
         self._client.speech_config.speech_synthesis_voice_name = self._voice
         self._client.speech_config.speech_synthesis_language = self._lang
 
-    def construct_prosody_tag(self, text:str ) -> str:
-        properties = []
-        rate = self.get_property("rate")
-        if rate != "":            
-            properties.append(f'rate="{rate}"')
-        
-        pitch = self.get_property("pitch")
-        if pitch != "":
-            properties.append(f'pitch="{pitch}"')
-    
-        volume = self.get_property("volume")
-        if volume != "":
-            properties.append(f'volume="{volume}"')
-        
-        prosody_content = " ".join(properties)
-        
-        text_with_tag = f'<prosody {prosody_content}>{text}</prosody>'
-        
-        return text_with_tag
-
     def synth_to_bytes(self, ssml: str, format: Optional[FileFormat] = "wav") -> bytes:
+        speechsdk = _speechsdk()
         format = self._client.FORMATS.get(format, "Riff24Khz16BitMonoPcm")
         self._client.speech_config.set_speech_synthesis_output_format(getattr(speechsdk.SpeechSynthesisOutputFormat, format))
         self.audio_config = None
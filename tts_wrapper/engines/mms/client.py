@@ -2,10 +2,12 @@ import requests
 import tempfile
 import os
 import json
+import threading
+import weakref
 import numpy as np
-import soundfile as sf
 from typing import List, Dict, Any, Optional, Union, Tuple
 from ...exceptions import ModuleNotInstalled, UnsupportedFileFormat, ModelNotFound
+from ...http import shared_session
 
 try:
     from ttsmms import TTS, download
@@ -13,6 +15,30 @@ except ImportError:
     TTS = None
     download = None
 
+# Loaded models, shared by every client using the same model directory while any of them is alive
+_models: "weakref.WeakValueDictionary[str, TTS]" = weakref.WeakValueDictionary()
+_models_lock = threading.Lock()
+
+
+def _load_model(model_dir: str, lang: str) -> "TTS":
+    """Returns the model for lang, downloading it into model_dir if it isn't there yet."""
+    model_path = os.path.join(model_dir, lang)
+    with _models_lock:
+        model = _models.get(model_path)
+        if model is None:
+            try:
+                model = TTS(model_path)
+            except Exception:
+                # If TTS initialization fails, attempt to download the model
+                try:
+                    download(lang, model_dir)
+                    model = TTS(model_path)
+                except Exception as download_error:
+                    raise ModelNotFound(lang, str(download_error))
+            _models[model_path] = model
+        return model
+
+
 class MMSClient:
     def __init__(self, params: Optional[Union[str, Tuple[Optional[str], str]]] = None) -> None:
         self._using_temp_dir = False
@@ -38,57 +64,46 @@ class MMSClient:
         self._initialize_tts(self.lang)
 
     def _initialize_tts(self, lang: str):
-        try:
-            model_path = os.path.join(self._model_dir, lang)
-            self._tts = TTS(model_path)
-            _tts.speaking_rate = 1.5
-        except Exception as e:
-            # If TTS initialization fails, attempt to download the model
-            try:
-                download(lang, self._model_dir)
-                new_model_path = os.path.join(self._model_dir, lang)
-                self._tts = TTS(new_model_path)
-            except Exception as download_error:
-                raise ModelNotFound(lang, str(download_error))
+        if getattr(self, "_tts_lang", None) == lang:
+            return
+        self._tts = _load_model(self._model_dir, lang)
+        self._tts_lang = lang
+
+    def synth(self, text: str, voice: str, lang: str, format: str, volume: Optional[float] = None) -> Dict[str, Any]:
+        """Synthesizes text to 16 bit PCM.
 
-    def synth(self, text: str, voice: str, lang: str, format: str) -> Dict[str, Any]:
+        @param volume: 0 to 100, applied to the model's float samples before they are converted
+        """
         if format.lower() != "wav":
             raise UnsupportedFileFormat(format, "MMSClient")
         
         # Ensure the TTS model is initialized for the correct language
         self._initialize_tts(lang)
 
-        # Use a temporary file for synthesis
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        temp_file.close()
-
         try:
-            # Perform the synthesis
-            self._tts.synthesis(text, wav_path=temp_file.name)
-            
-            # Read the file using soundfile
-            audio_data, sample_rate = sf.read(temp_file.name, dtype='float32')
-            
-            # Convert to 16-bit PCM
-            audio_data = (audio_data * 32767).astype(np.int16)
-            
-            # Ensure the file has been written correctly
+            # Without a wav_path the model's float32 samples are returned as they are,
+            # rather than written to a file and read back
+            result = self._tts.synthesis(text)
+            audio_data = result["x"].astype(np.float32, copy=False)
+            sample_rate = result["sampling_rate"]
+
             if audio_data.size == 0:
-                raise RuntimeError("Synthesis resulted in an empty file.")
-            
-            # Convert to bytes
-            audio_bytes = audio_data.tobytes()
-            
+                raise RuntimeError("Synthesis resulted in empty audio.")
+
+            if volume is not None:
+                audio_data *= np.float32(volume / 100)
+            np.clip(audio_data, -1.0, 1.0, out=audio_data)
+
+            # Convert to 16-bit PCM
+            audio_bytes = (audio_data * 32767).astype(np.int16).tobytes()
+
             return {
                 "audio_content": audio_bytes,
                 "sampling_rate": sample_rate
             }
         except Exception as e:
             raise RuntimeError(f"Synthesis failed: {str(e)}")
-        finally:
-            # Do not unlink the file for debugging purposes
-            os.unlink(temp_file.name)
-            
+
     def get_voices(self, ignore_cache: bool = False) -> List[Dict[str, Any]]:
         url = "https://dl.fbaipublicfiles.com/mms/tts/all-tts-languages.html"
         cache_file = os.path.join(tempfile.gettempdir(), "mms_voices_cache.json")
@@ -101,7 +116,7 @@ class MMSClient:
                 pass
 
         try:
-            response = requests.get(url)
+            response = shared_session().get(url)
             response.encoding = 'utf-8'
             response.raise_for_status()
             lines = response.text.strip().split('\n')
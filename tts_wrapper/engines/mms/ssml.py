@@ -9,5 +9,8 @@ class MMSSSML(BaseSSMLRoot):
         # MMS doesn't support SSML, so we just return the text content
         return "".join(str(c) for c in self._inner._children)
 
+    def build(self, child) -> str:
+        return str(child)
+
     def clear_ssml(self):
         pass
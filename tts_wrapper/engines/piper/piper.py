@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict
 
 from tts_wrapper.exceptions import UnsupportedFileFormat
 
@@ -6,9 +6,21 @@ from ...tts import AbstractTTS, FileFormat
 from . import PiperClient, PiperSSML
 import threading
 import time
-from ...engines.utils import estimate_word_timings  
+from ...engines.utils import estimate_word_timings, strip_ssml_tags
+
+# Piper has no SSML support, so the rate property is mapped onto its length_scale
+# (larger values mean slower speech).
+RATE_TO_LENGTH_SCALE = {
+    "x-slow": 1.5,
+    "slow": 1.25,
+    "medium": 1.0,
+    "fast": 0.8,
+    "x-fast": 0.6,
+}
 
 class PiperTTS(AbstractTTS):
+    supports_ssml = False
+
     @classmethod
     def supported_formats(cls) -> List[FileFormat]:
         return ["wav", "mp3"]
@@ -18,14 +30,26 @@ class PiperTTS(AbstractTTS):
         self._client = client
         self._voices = self.get_voices()
         self.set_voice(voice or "Joanna", lang or "en-US")
-        self.audio_rate = 16000
+        self.audio_rate = client.sample_rate
 
     def synth_to_bytes(self, text: Any, format: Optional[FileFormat] = "wav") -> bytes:
         if format not in self.supported_formats():
             raise UnsupportedFileFormat(format, self.__class__.__name__)
-        word_timings = estimate_word_timings(str(text))
+        plain_text = strip_ssml_tags(str(text))
+        word_timings = estimate_word_timings(plain_text)
         self.set_timings(word_timings)
-        return self._client.synth(str(text), format)
+        length_scale = RATE_TO_LENGTH_SCALE.get(self.get_property("rate"))
+        return self._client.synth(plain_text, format, length_scale=length_scale)
+
+    def synth_to_bytestream(self, text: Any, format: Optional[FileFormat] = "wav") -> Iterator[bytes]:
+        if format not in self.supported_formats():
+            raise UnsupportedFileFormat(format, self.__class__.__name__)
+        plain_text = strip_ssml_tags(str(text))
+        word_timings = estimate_word_timings(plain_text)
+        self.set_timings(word_timings)
+        length_scale = RATE_TO_LENGTH_SCALE.get(self.get_property("rate"))
+        # inference runs on the player's producer thread, one sentence at a time
+        return self._client.synth_stream(plain_text, length_scale=length_scale)
 
     @property
     def ssml(self) -> PiperSSML:
@@ -38,6 +62,3 @@ class PiperTTS(AbstractTTS):
         super().set_voice(voice_id)
         self._voice = voice_id
         self._lang = lang_id
-
-    def construct_prosody_tag(self, text:str ) -> str:
-        pass
\ No newline at end of file
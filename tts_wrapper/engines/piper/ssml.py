@@ -1,9 +1,9 @@
 from ...ssml import BaseSSMLRoot, SSMLNode, Child
 
 class PiperSSMLNode(SSMLNode):
-    def __str__(self) -> str:
+    def _render(self, children) -> str:
         # Override to generate only the inner content without the actual SSML tags
-        rendered_children = "".join(str(c) for c in self._children)
+        rendered_children = "".join(str(c) for c in children)
         return rendered_children
 
 class PiperSSMLRoot(BaseSSMLRoot):
@@ -15,4 +15,10 @@ class PiperSSMLRoot(BaseSSMLRoot):
         # Use the overridden __str__ method of PiperSSMLNode
         return str(self._inner)
 
-PiperSSML = BaseSSMLRoot
+    def build(self, child: Child) -> str:
+        return self._inner.build(child)
+
+    def clear_ssml(self):
+        self._inner.clear_ssml()
+
+PiperSSML = PiperSSMLRoot
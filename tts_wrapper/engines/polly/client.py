@@ -1,11 +1,15 @@
-from typing import Optional, Tuple, Dict, List, Any
+from typing import Optional, Tuple, Dict, List, Any, Iterator
 
 from ...engines.utils import process_wav
 from ...exceptions import ModuleNotInstalled
+import hashlib
 import json
+import threading
+import weakref
 
 try:
     import boto3
+    from botocore.config import Config
 except ImportError:
     boto3 = None  # type: ignore
 
@@ -17,8 +21,40 @@ FORMATS = {
     "mp3": "mp3",
 }
 
+MAX_POOL_CONNECTIONS = 10
+
+# Sample rate requested for PCM output; PollyTTS plays it back at this rate
+PCM_SAMPLE_RATE = "16000"
+
+
+def _client_config() -> "Config":
+    """Pools connections and keeps them alive with TCP keepalive between requests."""
+    try:
+        return Config(max_pool_connections=MAX_POOL_CONNECTIONS, tcp_keepalive=True)
+    except TypeError:
+        # botocore before 1.27.84 has no tcp_keepalive option
+        return Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+
 
 class PollyClient:
+    _shared: "weakref.WeakValueDictionary[str, PollyClient]" = weakref.WeakValueDictionary()
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls, credentials: Optional[Credentials] = None) -> "PollyClient":
+        """Returns a client for these credentials, reusing one that is still in use elsewhere.
+
+        Sharing the client shares its connection pool, so TTS instances created one
+        after another don't each open new TLS connections to Polly.
+        """
+        key = hashlib.sha1(repr(credentials).encode("utf-8")).hexdigest()
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls(credentials)
+                cls._shared[key] = client
+            return client
+
     def __init__(
         self,
         credentials: Optional[Credentials] = None,
@@ -37,22 +73,40 @@ class PollyClient:
                 aws_secret_access_key=aws_access_key,
                 region_name=region,
             )
-        self._client = boto_session.client("polly")
+        self._session = boto_session
+        # the voices on offer differ between regions
+        self.region = boto_session.region_name
+        self._client = boto_session.client("polly", config=_client_config())
 
-    def synth(self, ssml: str, voice: str, format: str) -> bytes:
-        raw = self._client.synthesize_speech(
+    def _synthesize_speech(self, ssml: str, voice: str, format: str) -> Any:
+        params = dict(
             Engine="neural",
             OutputFormat=FORMATS[format],
             VoiceId=voice,
             TextType="ssml",
             Text=ssml,
-        )["AudioStream"].read()
+        )
+        if FORMATS[format] == "pcm":
+            # ask for raw samples at the playback rate, so nothing needs decoding
+            params["SampleRate"] = PCM_SAMPLE_RATE
+        return self._client.synthesize_speech(**params)["AudioStream"]
+
+    def synth(self, ssml: str, voice: str, format: str) -> bytes:
+        raw = self._synthesize_speech(ssml, voice, format).read()
 
         if format == "wav":
             return process_wav(raw)
         else:
             return raw
 
+    def synth_stream(self, ssml: str, voice: str, format: str, chunk_size: int = 4096) -> Iterator[bytes]:
+        """Yields the audio as it arrives; "wav" is streamed as headerless PCM."""
+        stream = self._synthesize_speech(ssml, voice, format)
+        try:
+            yield from stream.iter_chunks(chunk_size)
+        finally:
+            stream.close()
+
     def get_speech_marks(self, ssml: str, voice: str) -> List[Dict[str, Any]]:
         response = self._client.synthesize_speech(
             Engine="neural",
@@ -1,8 +1,8 @@
-from typing import Any, List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict
 
 from tts_wrapper.exceptions import UnsupportedFileFormat
 
-from ...tts import AbstractTTS, FileFormat
+from ...tts import AbstractTTS, FileFormat, _build_prosody
 from . import PollyClient, PollySSML
 import threading
 import time
@@ -27,6 +27,14 @@ class PollyTTS(AbstractTTS):
         self.set_timings(word_timings)
         return self._client.synth(str(text), self._voice, format)
 
+    def synth_to_bytestream(self, text: Any, format: Optional[FileFormat] = "wav") -> Iterator[bytes]:
+        if format not in self.supported_formats():
+            raise UnsupportedFileFormat(format, self.__class__.__name__)
+        if not self._is_ssml(str(text)):
+            text = self.ssml.add(str(text))
+        word_timings = self._client.get_speech_marks(str(text), self._voice)
+        self.set_timings(word_timings)
+        return self._client.synth_stream(str(text), self._voice, format)
 
     @property
     def ssml(self) -> PollySSML:
@@ -34,7 +42,9 @@ class PollyTTS(AbstractTTS):
 
     def get_voices(self) -> List[Dict[str, Any]]:
         """Retrieves a list of available voices from the Polly service."""
-        return self._client.get_voices()
+        # neural and generative voices are only available in some regions
+        key = f"{self.__class__.__name__}:{self._client.region}"
+        return self.voice_cache.get_voices(key, self._client.get_voices)
                 
     def set_voice(self, voice_id: str, lang_id: str):
         """
@@ -47,26 +57,10 @@ class PollyTTS(AbstractTTS):
         self._lang = lang_id
 
     def construct_prosody_tag(self, text:str ) -> str:
-        properties = []
-        
-        #commenting this for now as currently we don't have ways to control rate and pitch without ssml
-        #rate = self.get_property("rate")
-        #if rate != "":            
-        #    properties.append(f'rate="{rate}"')
-        #
-        #pitch = self.get_property("pitch")
-        #if pitch != "":
-        #    properties.append(f'pitch="{pitch}"')
-    
+        #rate and pitch are left out for now as currently we don't have ways to control them without ssml
         volume_in_number = self.get_property("volume")
-        if volume_in_number != "":
-            volume_in_words = self.mapped_to_predefined_word(volume_in_number)
-            properties.append(f'volume="{volume_in_words}"')
-        
-        prosody_content = " ".join(properties)        
-        text_with_tag = f'<prosody {prosody_content}>{text}</prosody>'
-        
-        return text_with_tag
+        volume_in_words = self.mapped_to_predefined_word(volume_in_number) if volume_in_number != "" else ""
+        return _build_prosody("", "", volume_in_words, text)
 
     def mapped_to_predefined_word(self, volume: str) -> str:
         volume_in_float = float(volume)
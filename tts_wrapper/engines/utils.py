@@ -2,17 +2,51 @@ import os
 import random
 import string
 import tempfile
-import wave
-from io import BytesIO
 import re
+import struct
 from typing import List, Dict, Tuple
 
-def process_wav(raw: bytes) -> bytes:
-    bio = BytesIO()
-    with wave.open(bio, "wb") as wav:
-        wav.setparams((1, 2, 16000, 0, "NONE", "NONE"))  # type: ignore
-        wav.writeframes(raw)
-    return bio.getvalue()
+def wav_header(data_length: int, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Returns the 44 byte header of a PCM wav file holding data_length bytes of samples."""
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_length, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b"data", data_length,
+    )
+
+
+def write_audio_file(filename: str, *parts: bytes) -> None:
+    """Writes parts one after another to filename.
+
+    The audio goes to a temporary file that is then renamed over filename, so readers
+    never see a half written file and a failed write leaves no truncated one behind.
+    The file isn't read back, so the kernel is told it can drop its pages from the
+    page cache, which leaves room for things that are, such as model weights.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filename, "wb") as file:
+            for part in parts:
+                file.write(part)
+            file.flush()
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
+
+
+def process_wav(raw: bytes, sample_rate: int = 16000) -> bytes:
+    return wav_header(len(raw), sample_rate) + raw
 
 
 def create_temp_filename(suffix="") -> str:
@@ -22,9 +56,76 @@ def create_temp_filename(suffix="") -> str:
     )
 
 
+def adjust_volume(pcm: bytes, volume: float) -> bytes:
+    """Scales 16 bit PCM by volume, given from 0 to 100. Samples are clipped rather than wrapped around."""
+    import numpy as np
+
+    # np.frombuffer needs whole samples
+    if len(pcm) % 2 != 0:
+        pcm += b'\x00'
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    samples *= np.float32(volume / 100)
+    np.clip(samples, -32768, 32767, out=samples)
+    return samples.astype(np.int16).tobytes()
+
+
+def strip_ssml_tags(text: str) -> str:
+    """Removes all markup from an SSML string, leaving only the text to be spoken."""
+    if "<" not in text:
+        return text
+    return re.sub('<[^<]+?>', '', text)
+
+
+# Words that end in a full stop without ending the sentence
+ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e", "no"}
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_sentences(text: str, min_length: int = 10) -> List[str]:
+    """Splits text into sentences at ".", "!" or "?" followed by whitespace.
+
+    Abbreviations such as "Dr." and single initials don't end a sentence, and decimals
+    never do as there is no whitespace after the point. Sentences shorter than
+    min_length are joined to the next one.
+    """
+    sentences: List[str] = []
+    current = ""
+    for piece in _SENTENCE_END.split(text.strip()):
+        current = f"{current} {piece}" if current else piece
+        last_word = current.rsplit(None, 1)[-1]
+        if last_word.endswith("."):
+            word = last_word[:-1].lower()
+            if word in ABBREVIATIONS or (len(word) == 1 and word.isalpha()):
+                continue
+        if len(current) < min_length:
+            continue
+        sentences.append(current)
+        current = ""
+    if current:
+        if sentences and len(current) < min_length:
+            sentences[-1] = f"{sentences[-1]} {current}"
+        else:
+            sentences.append(current)
+    return sentences
+
+
+def strip_wav_header(audio: bytes) -> bytes:
+    """Returns the sample data of a RIFF/WAVE file, or the input unchanged if it has no header."""
+    if audio[:4] != b"RIFF" or audio[8:12] != b"WAVE":
+        return audio
+    position = 12
+    while position + 8 <= len(audio):
+        chunk_id = audio[position:position + 4]
+        chunk_size = int.from_bytes(audio[position + 4:position + 8], "little")
+        if chunk_id == b"data":
+            return audio[position + 8:]
+        position += 8 + chunk_size + (chunk_size & 1)
+    return audio
+
+
 def estimate_word_timings(text: str, wpm: int = 150) -> List[Tuple[float, str]]:
-    #remove ssml
-    text = re.sub('<[^<]+?>', '', text)
+    text = strip_ssml_tags(text)
     words = re.findall(r'\b\w+\b', text)
     words_per_second = wpm / 60
     seconds_per_word = 1 / words_per_second
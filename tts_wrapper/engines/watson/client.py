@@ -1,11 +1,11 @@
 from typing import Tuple, List, Dict, Any
-import requests
 import websocket
 import threading
 import json
 import logging
 
 from ...exceptions import ModuleNotInstalled
+from ...http import shared_session
 
 try:
     from ibm_cloud_sdk_core.authenticators import IAMAuthenticator  # type: ignore
@@ -31,8 +31,9 @@ class WatsonClient:
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self._client = client
+        self.region = region
         # Now websocket part
-        response = requests.post(
+        response = shared_session().post(
             "https://iam.cloud.ibm.com/identity/token",
             data={
                 "apikey": api_key,
@@ -82,7 +83,7 @@ class WatsonClient:
             logging.error(f"WebSocket error: {error}")
 
         def on_close(ws, status_code, reason):
-            logging.info(f"WebSocket closed with status code: {status_code}, reason: {reason}")
+            logging.info("WebSocket closed with status code: %s, reason: %s", status_code, reason)
 
         ws = websocket.WebSocketApp(self.ws_url + f"?access_token={self.iam_token}&voice={voice}", on_message=on_message, on_open=on_open, on_error=on_error, on_close=on_close)
 
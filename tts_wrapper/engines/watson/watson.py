@@ -35,7 +35,8 @@ class WatsonTTS(AbstractTTS):
 
     def get_voices(self) -> List[Dict[str, Any]]:
         """Retrieves a list of available voices from the Watson TTS service."""
-        return self._client.get_voices()    
+        key = f"{self.__class__.__name__}:{self._client.region}"
+        return self.voice_cache.get_voices(key, self._client.get_voices)
             
     def set_voice(self, voice_id: str, lang_id: str):
         """
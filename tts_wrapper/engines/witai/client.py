@@ -1,12 +1,9 @@
 import requests
 from ...tts import AbstractTTS, FileFormat
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 from ...exceptions import UnsupportedFileFormat
-import requests
 import logging
-from ...tts import AbstractTTS, FileFormat
-from typing import Any, Dict, Optional, List
-from ...exceptions import UnsupportedFileFormat
+from ...http import shared_session
 
 FORMATS = {
     "mp3": "mp3",
@@ -43,7 +40,7 @@ class WitAiClient:
             "Authorization": f"Bearer {self.token}"
         }
         try:
-            response = requests.get(f"{self.base_url}/voices?v={self.api_version}", headers=headers)
+            response = shared_session().get(f"{self.base_url}/voices?v={self.api_version}", headers=headers)
             response.raise_for_status()
             voices = response.json()
             standardized_voices = []
@@ -59,23 +56,37 @@ class WitAiClient:
                     })
             return standardized_voices
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch voices from Wit.ai: {e}")
+            logging.error(f"Failed to fetch voices from Wit.ai: {e}")
             raise
         
-    def synth(self, text: str, voice: str, format: str = "pcm") -> bytes:
-        self.headers["Content-Type"] = "application/json"
-        self.headers["Accept"] = self._get_mime_type(format)
-    
-        
+    def _post_synthesize(self, text: str, voice: str, format: str, stream: bool = False) -> "requests.Response":
+        # headers are built per request, the client may be used from several threads
+        headers = dict(self.headers, **{"Content-Type": "application/json", "Accept": self._get_mime_type(format)})
         data = {
             "q": text,
             "voice": voice
         }
-        
+        response = shared_session().post(
+            f"{self.base_url}/synthesize?v={self.api_version}", headers=headers, json=data, stream=stream
+        )
+        response.raise_for_status()
+        return response
+
+    def synth(self, text: str, voice: str, format: str = "pcm") -> bytes:
         try:
-            response = requests.post(f"{self.base_url}/synthesize?v={self.api_version}", headers=self.headers, json=data)
-            response.raise_for_status()
-            return response.content
+            return self._post_synthesize(text, voice, format).content
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to synthesize text with Wit.ai: {e}")
+            logging.error(f"Failed to synthesize text with Wit.ai: {e}")
             raise
+
+    def synth_stream(self, text: str, voice: str, chunk_size: int = 4096) -> Iterator[bytes]:
+        """Yields raw PCM as it arrives, so playback can start before the response is complete."""
+        try:
+            response = self._post_synthesize(text, voice, "pcm", stream=True)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to synthesize text with Wit.ai: {e}")
+            raise
+        try:
+            yield from response.iter_content(chunk_size)
+        finally:
+            response.close()
@@ -1,5 +1,5 @@
 from ...tts import AbstractTTS, FileFormat
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from . import WitAiClient, WitAiSSML
 from ...engines.utils import estimate_word_timings  # Import the timing estimation function
 from ...exceptions import UnsupportedFileFormat
@@ -25,6 +25,15 @@ class WitAiTTS(AbstractTTS):
         self.set_timings(word_timings)
         return self._client.synth(str(text), self._voice, format)
 
+    def synth_to_bytestream(self, text: Any, format: Optional[FileFormat] = "wav") -> Iterator[bytes]:
+        """Streams the audio for playback; "wav" is streamed as headerless PCM."""
+        if format not in ["pcm", "wav"]:
+            return super().synth_to_bytestream(text, format)
+        if not self._is_ssml(str(text)):
+            text = self.ssml.add(str(text))
+        self.set_timings(estimate_word_timings(str(text)))
+        return self._client.synth_stream(str(text), self._voice)
+
     @property
     def ssml(self) -> WitAiSSML:
         """Returns an instance of the WitSSML class for constructing SSML strings."""
@@ -32,7 +41,7 @@ class WitAiTTS(AbstractTTS):
 
     def get_voices(self) -> List[Dict[str, Any]]:
         """Retrieves a list of available voices from the Wit.ai service."""
-        return self._client.get_voices()
+        return self.voice_cache.get_voices(self.__class__.__name__, self._client.get_voices)
 
     def set_voice(self, voice_id: str, lang_id: str):
         """Sets the voice for the TTS engine."""
@@ -0,0 +1,42 @@
+import threading
+from typing import Optional
+
+from .exceptions import ModuleNotInstalled
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+except ImportError:
+    requests = None  # type: ignore
+
+POOL_SIZE = 16
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def shared_session() -> "requests.Session":
+    """Returns the process-wide requests.Session used by the REST based clients.
+
+    The session keeps connections alive between calls, so repeated requests to the
+    same host skip the TCP/TLS handshake. Failed connections are retried with a
+    short backoff.
+    """
+    global _session
+    if _session is None:
+        if requests is None:
+            raise ModuleNotInstalled("requests")
+        with _session_lock:
+            if _session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_SIZE,
+                    pool_maxsize=POOL_SIZE,
+                    max_retries=Retry(total=3, backoff_factor=0.2),
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Connection"] = "keep-alive"
+                _session = session
+    return _session
@@ -0,0 +1,101 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # not on Windows, where apt isn't used anyway
+    fcntl = None
+
+# Written by apt on every successful update
+APT_UPDATE_STAMP = "/var/lib/apt/periodic/update-success-stamp"
+
+APT_LOCK = "/tmp/tts_wrapper_apt.lock"
+
+# System packages needed on Linux, installed together in a single apt-get call
+PACKAGES = [
+    "portaudio19-dev",
+    # Add other system dependencies here
+]
+
+
+# Already root (e.g. in a container): run apt directly instead of through sudo
+# (os.geteuid is missing on Windows)
+SUDO = [] if not hasattr(os, "geteuid") or os.geteuid() == 0 else ["sudo"]
+
+
+def _run_as_root(command):
+    """Runs command as root, through sudo unless we already are root."""
+    subprocess.run([*SUDO, *command], check=True)
+
+
+@contextmanager
+def _apt_lock():
+    """Serializes our apt-get runs, so that two installs at once wait for each other
+    instead of failing on the dpkg lock."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(APT_LOCK, os.O_CREAT | os.O_RDWR, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _apt_update_if_stale(max_age=3600):
+    """Runs apt-get update unless it last succeeded less than max_age seconds ago.
+
+    Set TTS_WRAPPER_SKIP_APT_UPDATE=1 to skip it altogether, e.g. in CI images that
+    have just been updated.
+    """
+    if os.environ.get("TTS_WRAPPER_SKIP_APT_UPDATE") == "1":
+        return
+    try:
+        if time.time() - os.stat(APT_UPDATE_STAMP).st_mtime < max_age:
+            return
+    except OSError:
+        pass
+    _run_as_root(["apt-get", "update"])
+
+
+def _apt_command():
+    """Returns apt-fast, which downloads packages in parallel, if it is installed, else apt-get.
+
+    Set TTS_WRAPPER_NO_APT_FAST=1 to always use apt-get.
+    """
+    if os.environ.get("TTS_WRAPPER_NO_APT_FAST") != "1" and shutil.which("apt-fast"):
+        return "apt-fast"
+    return "apt-get"
+
+
+def install_linux_dependencies(packages=PACKAGES):
+    """Updates the package lists if they are stale and installs all packages in one apt transaction."""
+    with _apt_lock():
+        _apt_update_if_stale()
+        _run_as_root([_apt_command(), "install", "-y", *packages])
+
+
+def main():
+    # Check if the operating system is Linux
+    if os.name != 'posix' or sys.platform != 'linux':
+        print("This script is intended to run on Linux systems only.", file=sys.stderr)
+        sys.exit(1)
+    
+    print("Installing system dependencies...")
+
+    try:
+        install_linux_dependencies()
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error installing {' '.join(PACKAGES)}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("System dependencies installed successfully.")
+
+if __name__ == "__main__":
+    main()
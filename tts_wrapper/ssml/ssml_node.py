@@ -51,10 +51,33 @@ class SSMLNode(AbstractSSMLNode):
     def __str__(self) -> str:
         """Returns a string representation of text-to-speech using tags HTML like."""
 
+        return self._render(self._children)
+
+    def _render(self, children: List[Child]) -> str:
+        """Renders this node's tag and attributes around the given children."""
+
         attrs = " ".join(f'{k}="{v}"' for k, v in self._attrs.items())
-        rendered_children = "".join(str(c) for c in self._children)
+        rendered_children = "".join(str(c) for c in children)
         return f"<{self._tag}{(' ' if attrs else '')}{attrs}>{rendered_children}</{self._tag}>"
 
+    def _render_replacing(self, node: "SSMLNode", children: List[Child]) -> str:
+        """Renders the tree with the children of node swapped for the given ones."""
+
+        if self is node:
+            return self._render(children)
+        return self._render(
+            [c._render_replacing(node, children) if isinstance(c, SSMLNode) else c for c in self._children]
+        )
+
+    def build(self, child: Child) -> str:
+        """Renders this node with child as its only content, without changing the node.
+
+        @param child: child with Any type to be rendered inside the node
+        @returns: string representation of the node
+        """
+
+        return self._render([child])
+
     def add(self, child: Child) -> "SSMLNode":
         """Adds a child with Any type to the children list property.
 
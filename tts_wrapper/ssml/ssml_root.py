@@ -1,5 +1,29 @@
+from xml.sax.saxutils import escape
+
 from . import AbstractSSMLNode, Child, SSMLNode
 
+# stands in for the text while a template is rendered
+_TEXT_SLOT = "\x00text\x00"
+
+
+class CompiledSSML:
+    """An SSML document built once, with a slot for the text of each utterance.
+
+    @param prefix: everything before the text
+    @param suffix: everything after the text
+    """
+
+    def __init__(self, prefix: str, suffix: str) -> None:
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def render(self, text: str) -> str:
+        """Returns the document for text. The text is XML-escaped if the document has markup."""
+
+        if self.prefix or self.suffix:
+            text = escape(text)
+        return f"{self.prefix}{text}{self.suffix}"
+
 
 class BaseSSMLRoot(AbstractSSMLNode):
     def __init__(self) -> None:
@@ -12,4 +36,23 @@ class BaseSSMLRoot(AbstractSSMLNode):
     def add(self, child: Child) -> "AbstractSSMLNode":
         self._inner.add(child)
         return self
-    
\ No newline at end of file
+
+    def build(self, child: Child) -> str:
+        """Returns the SSML document for child alone.
+
+        Unlike add, nothing is kept on the root, so there is no need to call clear_ssml
+        between phrases.
+        """
+        return self._root._render_replacing(self._inner, [child])
+
+    def compile_template(self) -> CompiledSSML:
+        """Builds the document around an empty slot, for speaking many short phrases.
+
+        The markup is rendered once here instead of on every phrase; only the text
+        is escaped and inserted by CompiledSSML.render.
+        """
+        document = self.build(_TEXT_SLOT)
+        if document.count(_TEXT_SLOT) != 1:
+            raise ValueError(f"{self.__class__.__name__} builds its markup from the text and can't be compiled")
+        prefix, suffix = document.split(_TEXT_SLOT)
+        return CompiledSSML(prefix, suffix)
@@ -1,34 +1,215 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Literal, Optional, Union, Dict, Callable
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union, Dict, Callable
+import array
+import asyncio
 import pyaudio
 import threading
 from threading import Event
+import atexit
+import inspect
 import logging
+import logging.handlers
+import queue
 import time
 import re
-import wave
+import sys
+
+from ._synth_cache import SynthCache, cached_synth, synth_cache
+from ._voice_cache import VoiceCache, voice_cache
 
 FileFormat = Union[Literal["wav"], Literal["mp3"]]
 
+# Default milliseconds of audio buffered before streamed playback starts, so the
+# output stream doesn't stutter while the rest is still being synthesized.
+PREROLL_MS = 250
+
+FADE_IN_MS = 50
+
+# Words starting within this many seconds of each other are dispatched together
+WORD_BATCH_WINDOW = 0.02
+
+
+class PreRollBuffer:
+    """Holds streamed 16 bit PCM and gates playback until enough of it has arrived.
+
+    pop returns silence until preroll_bytes are buffered ahead of the play position, or
+    the stream is finished. If playback catches up with synthesis, or reset is called
+    (on pause, resume and stop), it waits for the pre-roll again before playing on.
+
+    @param preroll_bytes: bytes to buffer before audio is released
+    """
+
+    def __init__(self, preroll_bytes: int) -> None:
+        self.preroll_bytes = preroll_bytes
+        self.position = 0
+        self._data = bytearray()
+        self._primed = False
+        self._eof = False
+        self._lock = threading.Lock()
+
+    def push(self, pcm: bytes) -> None:
+        with self._lock:
+            self._data.extend(pcm)
+
+    def finish(self) -> None:
+        """Marks the end of the stream; whatever is buffered is then played out."""
+        with self._lock:
+            self._eof = True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._primed = False
+
+    @property
+    def finished(self) -> bool:
+        return self._eof and self.position >= len(self._data)
+
+    def pop(self, n_bytes: int) -> bytes:
+        """Returns the next n_bytes of audio, padded with silence while buffering.
+
+        Only once the stream is finished can the result be shorter than n_bytes.
+        """
+        with self._lock:
+            available = len(self._data) - self.position
+            if not self._primed:
+                if available < self.preroll_bytes and not self._eof:
+                    return b"\x00" * n_bytes
+                self._primed = True
+            data = bytes(self._data[self.position:self.position + n_bytes])
+            if len(data) < n_bytes and not self._eof:
+                # underrun: play the whole samples we have and buffer up again
+                data = data[:len(data) - len(data) % 2]
+                self._primed = False
+                self.position += len(data)
+                return data + b"\x00" * (n_bytes - len(data))
+            self.position += len(data)
+            return data
+
+
+Word = Tuple[str, float, float]
+
+
+def _word_table(timings: List[Tuple[float, str]]) -> List[Tuple[float, List[Word]]]:
+    """Groups (start_time, word) timings into (start_time, [(word, start, end), ...]) windows.
+
+    Words starting within WORD_BATCH_WINDOW seconds of a window's first word join it.
+    A word ends where the next one starts.
+    """
+    timings = sorted(timings)
+    table: List[Tuple[float, List[Word]]] = []
+    for i, (start, word) in enumerate(timings):
+        end = timings[i + 1][0] if i + 1 < len(timings) else start
+        if table and start - table[-1][0] < WORD_BATCH_WINDOW:
+            table[-1][1].append((word, start, end))
+        else:
+            table.append((start, [(word, start, end)]))
+    return table
+
+
+class WordDispatcher(threading.Thread):
+    """Calls dispatch with each window of a word table once its start time is reached.
+
+    A single thread walks the whole table, sleeping between windows, instead of
+    starting a timer thread per window. cancel stops it like Timer.cancel does.
+
+    @param clock: returns the current time in seconds, time.time by default
+    """
+
+    def __init__(self, table: List[Tuple[float, List[Word]]], dispatch: Callable[[List[Word]], None],
+                 start_time: Optional[float] = None, clock: Callable[[], float] = time.time) -> None:
+        super().__init__(daemon=True)
+        self.table = table
+        self.dispatch = dispatch
+        self.clock = clock
+        self.start_time = clock() if start_time is None else start_time
+        self._cancelled = Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        for start, batch in self.table:
+            delay = start - (self.clock() - self.start_time)
+            if self._cancelled.wait(max(delay, 0)):
+                return
+            self.dispatch(batch)
+
+
+def _positional_arity(callback: Callable) -> int:
+    """Returns how many positional arguments callback takes, capped at 3."""
+    try:
+        params = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return 2
+    if any(p.kind == p.VAR_POSITIONAL for p in params):
+        return 3
+    positional = sum(1 for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+    return max(1, min(positional, 3))
+
+
+@lru_cache(maxsize=256)
+def _prosody_opening_tag(rate: str, pitch: str, volume: str) -> str:
+    """Returns the opening prosody tag for a set of properties, leaving out any that are empty.
+
+    The tag only changes when a property does, so it is built once per combination.
+    """
+    properties = []
+    if rate != "":
+        properties.append(f'rate="{rate}"')
+    if pitch != "":
+        properties.append(f'pitch="{pitch}"')
+    if volume != "":
+        properties.append(f'volume="{volume}"')
+    prosody_content = " ".join(properties)
+    return f'<prosody {prosody_content}>'
+
+
+def _build_prosody(rate: str, pitch: str, volume: str, text: str) -> str:
+    """Wraps text in a prosody tag, leaving out any attribute that is empty."""
+    return f'{_prosody_opening_tag(rate, pitch, volume)}{text}</prosody>'
+
 class AbstractTTS(ABC):
     """Abstract class (ABC) for text-to-speech functionalities, including synthesis and playback."""
 
+    # Engines that can't parse SSML set this to False; they get plain text and apply
+    # rate/pitch/volume through their own API instead of prosody tags.
+    supports_ssml: bool = True
+
+    _log_listener: Optional[logging.handlers.QueueListener] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # every engine's synth_to_bytes goes through the shared synthesis cache, once it is turned on
+        if "synth_to_bytes" in cls.__dict__:
+            cls.synth_to_bytes = cached_synth(cls.__dict__["synth_to_bytes"])
+
     def __init__(self):
         self.voice_id = None
         self.audio_object = None
         self.p = pyaudio.PyAudio()
         self.stream = None
+        self.output_device: Optional[int] = None  # None is the system default
+        # blocking streams used by speak, kept open per (device, rate, channels, format)
+        self._output_streams: Dict[Tuple[Optional[int], int, int, int], Any] = {}
         self.audio_rate = 22050
         self.audio_bytes = None
         self.playing = Event()
         self.playing.clear()  # Not playing by default
+        self.done_event = Event()  # Set whenever nothing is queued for playback
+        self.done_event.set()
+        self.first_audio_event = Event()  # Set once streamed audio reaches the device
+        # "idle", "buffering" (started but no audio out yet), "playing" or "paused"
+        self._state = "idle"
+        self._state_cond = threading.Condition()
         self.position = 0  # Position in the byte stream
         self.timings = []
         self.timers = []
         self.properties = {
             'volume' :"",
             'rate': "",
-            'pitch':""
+            'pitch':"",
+            'preroll_ms': PREROLL_MS
         }
         self.callbacks = {
             'onStart': None,
@@ -36,8 +217,50 @@ class AbstractTTS(ABC):
             'started-word': None
         }
         self.stream_lock = threading.Lock()
+        self.buffer: Optional[PreRollBuffer] = None
 
 
+    @classmethod
+    def configure_logging(cls, level: int = logging.INFO, quiet_loggers: Sequence[str] = ("azure",)) -> logging.handlers.QueueListener:
+        """Sets up logging so that playback threads never block on writing to stderr.
+
+        Records are put on a queue and written out by a background QueueListener. Noisy
+        SDK loggers (the Azure Speech SDK logs every streamed chunk at DEBUG) are capped
+        at WARNING. Calling this more than once returns the already running listener.
+
+        @param level: level for the root logger
+        @param quiet_loggers: names of loggers to cap at WARNING
+        @returns: the running listener
+        """
+        if AbstractTTS._log_listener is not None:
+            return AbstractTTS._log_listener
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        listener = logging.handlers.QueueListener(log_queue, handler)
+
+        root = logging.getLogger()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(level)
+        for name in quiet_loggers:
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+        listener.start()
+        atexit.register(listener.stop)
+        AbstractTTS._log_listener = listener
+        return listener
+
+    @property
+    def cache(self) -> SynthCache:
+        """The process-wide cache of synthesized audio, off until max_entries is set, see stats() and clear()."""
+        return synth_cache
+
+    @property
+    def voice_cache(self) -> VoiceCache:
+        """The on-disk cache of voice lists used by engines with slow voice lookups, see clear()."""
+        return voice_cache
+
     @abstractmethod
     def get_voices(self) -> List[Dict[str, Any]]:
         """Retrieves a list of available voices from the TTS service."""
@@ -58,39 +281,157 @@ class AbstractTTS(ABC):
         """Transforms written text to audio bytes on supported formats."""
         pass
 
+    def synth_to_bytestream(self, text: Any, format: Optional[FileFormat] = "wav") -> Iterator[bytes]:
+        """Yields audio in chunks as it is synthesized.
+
+        Engines that can stream from their service override this; the default yields
+        the whole of synth_to_bytes as a single chunk.
+        """
+        yield self.synth_to_bytes(text, format)
+
     def synth_to_file(self, text: Any, filename: str, format: Optional[FileFormat] = None) -> None:
-        print ("text synth to file: ", text)
-        audio_content = self.synth_to_bytes(text, format=format or "wav")
+        logging.debug("text synth to file: %s", text)
+        format = format or "wav"
+        audio_content = self.synth_to_bytes(text, format=format)
         #audio_content = self.apply_fade_in(audio_content)
-        
-        #open file and add wav header before write in the audio content
-        channels = 1
-        sample_width = 2 #8 bit audio      
-        with wave.open(filename, "wb") as file:
-            file.setnchannels(channels)
-            file.setsampwidth(sample_width)
-            file.setframerate(self.audio_rate)
-            file.writeframes(audio_content)
+        self._write_audio_file(audio_content, filename, format)
+
+    def _write_audio_file(self, audio_content: bytes, filename: str, format: FileFormat) -> None:
+        from .engines.utils import wav_header, write_audio_file
+
+        # mp3 and engines that already return a complete wav file are written as is
+        if format != "wav" or audio_content[:4] == b"RIFF":
+            write_audio_file(filename, audio_content)
+        else:
+            # bare 16 bit mono samples, add the wav header in front of them
+            write_audio_file(filename, wav_header(len(audio_content), self.audio_rate), audio_content)
 
     def synth(self, text: str, filename: str, format: Optional[FileFormat] = "wav"):
         self.synth_to_file(text, filename, format)
 
+    async def speak_and_save_parallel(self, text: Any, filename: str, format: Optional[FileFormat] = "wav",
+                                      callback=None, callback_batch=None):
+        """Speaks the text and saves it to a file at the same time.
+
+        The text is synthesized once and the audio is then written to the file while it
+        plays. Only wav can be played, so for other formats the file's audio is
+        synthesized right after the wav used for playback. The two calls never run at
+        the same time, as engines keep per-call state such as the output format.
+
+        @param callback, callback_batch: word callbacks, as for start_playback_with_callbacks
+        """
+        loop = asyncio.get_running_loop()
+        format = format or "wav"
+
+        def play(audio: bytes):
+            self._speak_bytestream([audio])
+            if callback is not None or callback_batch is not None:
+                self._schedule_word_callbacks(callback, callback_batch)
+            self.drain()
+
+        audio = await loop.run_in_executor(None, self.synth_to_bytes, text, "wav")
+        file_audio = audio
+        if format != "wav":
+            timings = self.timings
+            file_audio = await loop.run_in_executor(None, self.synth_to_bytes, text, format)
+            # the word callbacks follow the audio being played
+            self.set_timings(timings)
+        await asyncio.gather(
+            loop.run_in_executor(None, self._write_audio_file, file_audio, filename, format),
+            loop.run_in_executor(None, play, audio),
+        )
+
+    async def synth_many(self, items: Iterable[Tuple[Any, str]], format: Optional[FileFormat] = "wav",
+                         concurrency: int = 1):
+        """Synthesizes each (text, filename) pair to its file, up to concurrency at a time.
+
+        All items are synthesized on this one engine, and engines keep per-call state on
+        it: word timings (Google, Microsoft, Polly, Watson, ElevenLabs, Piper, Wit.Ai, UWP)
+        and, for Microsoft, the synthesizer and output format. With concurrency above 1
+        that state can belong to another item, and so can the timings stored in the synth
+        cache. Only raise it for engines that keep no such state, such as Pico, where it
+        overlaps the syntheses.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def synth_one(text: Any, filename: str):
+            async with semaphore:
+                await loop.run_in_executor(None, self.synth_to_file, text, filename, format)
+
+        await asyncio.gather(*(synth_one(text, filename) for text, filename in items))
+
     def speak(self, text: Any, format: Optional[FileFormat] = "wav") -> bytes:
+        from .engines.utils import strip_wav_header  # engines import this module
+
+        # chunks are written as they arrive, so playback starts with the first one
+        fade_bytes = int(FADE_IN_MS * self.audio_rate / 1000) * 2
         try:
-            audio_bytes = self.synth_to_bytes(text, format)
-            audio_bytes = self.apply_fade_in(audio_bytes)
-            p = pyaudio.PyAudio()
-            stream = p.open(format=pyaudio.paInt16, channels=1, rate=self.audio_rate, output=True)
-            stream.write(audio_bytes)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+            stream = self._get_output_stream(self.audio_rate)
+            pending = bytearray()
+            started = False
+            for chunk in self.synth_to_bytestream(text, format):
+                pending.extend(chunk)
+                if not started:
+                    if len(pending) < fade_bytes:
+                        continue
+                    pending = bytearray(self.apply_fade_in(strip_wav_header(bytes(pending)), FADE_IN_MS, self.audio_rate))
+                    started = True
+                # only whole samples, an odd byte waits for the next chunk
+                whole = len(pending) - len(pending) % 2
+                stream.write(bytes(pending[:whole]))
+                del pending[:whole]
+            if not started:
+                pending = bytearray(self.apply_fade_in(strip_wav_header(bytes(pending)), FADE_IN_MS, self.audio_rate))
+            if len(pending) > 1:
+                stream.write(bytes(pending[:len(pending) - len(pending) % 2]))
         except Exception as e:
             logging.error(f"Error playing audio: {e}")
+
+    def set_output_device(self, device_index: Optional[int]):
+        """Plays audio on the PyAudio output device with this index, or the default device for None."""
+        self.output_device = device_index
+        self._close_output_streams()
+
+    def _get_output_stream(self, rate: int, channels: int = 1, format: int = pyaudio.paInt16):
+        """Returns an open blocking output stream, reusing the last one if nothing has changed.
+
+        Opening a stream takes PortAudio tens of milliseconds, so the stream is kept
+        open between calls to speak and only replaced when the device, rate, channel
+        count or sample format differs.
+        """
+        key = (self.output_device, rate, channels, format)
+        stream = self._output_streams.get(key)
+        if stream is None:
+            self._close_output_streams()
+            if self.p is None:
+                self.p = pyaudio.PyAudio()
+            stream = self.p.open(format=format,
+                                 channels=channels,
+                                 rate=rate,
+                                 output=True,
+                                 output_device_index=self.output_device)
+            self._output_streams[key] = stream
+        return stream
+
+    def _close_output_streams(self):
+        for stream in self._output_streams.values():
+            try:
+                stream.stop_stream()
+                stream.close()
+            except Exception as e:
+                logging.error(f"Failed to close audio stream: {e}")
+        self._output_streams.clear()
     
-    @abstractmethod
     def construct_prosody_tag(self, text:str) -> str:
-        pass
+        """Wraps text in a prosody tag built from the current rate, pitch and volume.
+
+        Engines without SSML support get the text back unchanged; they apply the
+        properties themselves.
+        """
+        if not self.supports_ssml:
+            return text
+        return _build_prosody(self.get_property("rate"), self.get_property("pitch"), self.get_property("volume"), text)
 
     def setup_stream(self, format=pyaudio.paInt16, channels=1):
         try:
@@ -104,36 +445,95 @@ class AbstractTTS(ABC):
                                       channels=channels,
                                       rate=self.audio_rate,
                                       output=True,
+                                      output_device_index=self.output_device,
                                       stream_callback=self.callback)
         except Exception as e:
             logging.error(f"Failed to setup audio stream: {e}")
             raise
 
     def callback(self, in_data, frame_count, time_info, status):
-        if self.playing:
-            end_position = self.position + frame_count * 2
-            data = self.audio_bytes[self.position:end_position]
-            self.position = end_position
-            if self.position >= len(self.audio_bytes):
+        if self.playing.is_set():
+            # PyAudio ends the stream on a short buffer, so the pre-roll buffer pads
+            # with silence until synthesis is finished
+            data = self.buffer.pop(frame_count * 2)
+            self.position = self.buffer.position
+            if self.position > 0 and not self.first_audio_event.is_set():
+                self.first_audio_event.set()
+                self._set_state("playing")
+            if self.buffer.finished:
                 self._trigger_callback('onEnd')
+                self._set_state("idle")
+                self.done_event.set()
                 return (data, pyaudio.paComplete)
             return (data, pyaudio.paContinue)
         else:
-            return (None, pyaudio.paContinue)
+            return (b"\x00" * frame_count * 2, pyaudio.paContinue)
 
 
     def speak_streamed(self, text: Any, format: Optional[FileFormat] = "wav"):
+        logging.info("[TTS.speak_streamed] Starting speech synthesis...")
         try:
-            logging.info("[TTS.speak_streamed] Starting speech synthesis...")
-            audio_bytes = self.synth_to_bytes(text, format)
-            if not isinstance(audio_bytes, (bytes, bytearray)):
-                raise ValueError("[TTS.speak_streamed] Synthesized speech is not in bytes format")
-            logging.info(f"[TTS.speak_streamed] Synthesized speech length: {len(audio_bytes)} bytes")
+            chunks = self.synth_to_bytestream(text, format)
         except Exception as e:
             logging.error(f"[TTS.speak_streamed] Error synthesizing speech: {e}")
             return
-        self.audio_bytes = self.apply_fade_in(audio_bytes)
+        self._speak_bytestream(chunks)
+
+    def speak_streamed_chunked(self, text: Any, format: Optional[FileFormat] = "wav"):
+        """Speaks long text one sentence at a time.
+
+        The next sentence is synthesized while the current one is playing, so playback
+        starts once the first sentence is ready. SSML is spoken as a whole.
+        """
+        from .engines.utils import split_sentences  # engines import this module
+
+        text = str(text)
+        sentences = [text] if self._is_ssml(text) else split_sentences(text)
+        self._speak_bytestream(self._synth_sentences(sentences, format))
+
+    def _synth_sentences(self, sentences: List[str], format: Optional[FileFormat]) -> Iterator[bytes]:
+        from .engines.utils import strip_wav_header
+
+        for sentence in sentences:
+            yield strip_wav_header(self.synth_to_bytes(sentence, format))
+
+    def _speak_bytestream(self, chunks: Iterable[bytes]):
+        from .engines.utils import strip_wav_header
+
+        # the first chunk is read here so that synthesis errors are reported before
+        # playback starts, and so the engine has set its word timings
+        fade_bytes = int(FADE_IN_MS * self.audio_rate / 1000) * 2
+        try:
+            chunks = iter(chunks)
+            head = bytearray()
+            for chunk in chunks:
+                if not isinstance(chunk, (bytes, bytearray)):
+                    raise ValueError("[TTS.speak_streamed] Synthesized speech is not in bytes format")
+                head.extend(chunk)
+                if len(head) >= fade_bytes:
+                    break
+        except Exception as e:
+            logging.error(f"[TTS.speak_streamed] Error synthesizing speech: {e}")
+            return
+        # the player wants bare samples, a wav header would be heard as a click
+        head = strip_wav_header(bytes(head))
+        self._play_bytestream(self.apply_fade_in(head, FADE_IN_MS, self.audio_rate), chunks)
+
+    def _preroll_bytes(self) -> int:
+        preroll_ms = float(self.get_property("preroll_ms") or 0)
+        return int(preroll_ms * self.audio_rate / 1000) * 2
+
+    def _play_bytestream(self, head: bytes, chunks: Iterable[bytes]):
+        """Starts playback of head and keeps pushing chunks from a producer thread."""
+        buffer = PreRollBuffer(self._preroll_bytes())
+        buffer.push(head)
+        self.buffer = buffer
         self.position = 0
+        self.first_audio_event.clear()
+        self.done_event.clear()
+        self._set_state("buffering")
+        self.feed_thread = threading.Thread(target=self._feed_bytestream, args=(buffer, chunks), daemon=True)
+        self.feed_thread.start()
         self.playing.set()
         self._trigger_callback('onStart')
 
@@ -150,18 +550,31 @@ class AbstractTTS(ABC):
             logging.error(f"[TTS.speak_streamed] Failed to play audio: {e}")
             raise
 
+    def _feed_bytestream(self, buffer: PreRollBuffer, chunks: Iterable[bytes]):
+        try:
+            for chunk in chunks:
+                if self.buffer is not buffer:
+                    # a newer speak_streamed call has replaced this buffer
+                    break
+                buffer.push(chunk)
+        except Exception as e:
+            logging.error(f"[TTS.speak_streamed] Error synthesizing speech: {e}")
+        finally:
+            buffer.finish()
+
     def apply_fade_in(self, audio_bytes, fade_duration_ms=50, sample_rate=22050):
         num_fade_samples = int(fade_duration_ms * sample_rate / 1000)
-        fade_in = [i / num_fade_samples for i in range(num_fade_samples)]
-    
-        audio_samples = list(int.from_bytes(audio_bytes[2 * i:2 * i + 2], 'little', signed=True)
-                             for i in range(len(audio_bytes) // 2))
-    
-        for i in range(min(len(audio_samples), num_fade_samples)):
-            audio_samples[i] = int(audio_samples[i] * fade_in[i])
-    
-        faded_audio_bytes = b''.join((sample.to_bytes(2, 'little', signed=True) for sample in audio_samples))
-        return faded_audio_bytes
+        fade_length = min(len(audio_bytes) // 2, num_fade_samples) * 2
+
+        # only the first samples change, the rest of the audio is passed through as is
+        head = array.array('h', bytes(audio_bytes[:fade_length]))
+        if sys.byteorder == "big":
+            head.byteswap()
+        for i in range(len(head)):
+            head[i] = int(head[i] * i / num_fade_samples)
+        if sys.byteorder == "big":
+            head.byteswap()
+        return head.tobytes() + bytes(audio_bytes[fade_length:])
         
     def _start_stream(self):
         with self.stream_lock:
@@ -174,11 +587,52 @@ class AbstractTTS(ABC):
                 self.stream.close()
                 self.stream = None
 
+    @property
+    def isplaying(self) -> bool:
+        """True from the start of a streamed playback until it ends or is stopped; pausing doesn't end it."""
+        return not self.done_event.is_set()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until streamed playback has ended and the device has played out the last buffer.
+
+        @param timeout: seconds to wait at most, or None to wait for as long as it takes
+        @returns: True if playback ended, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.done_event.wait(timeout):
+            return False
+        play_thread = getattr(self, "play_thread", None)
+        if play_thread is not None and play_thread is not threading.current_thread():
+            play_thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            return not play_thread.is_alive()
+        return True
+
+    def _set_state(self, state: str):
+        with self._state_cond:
+            self._state = state
+            self._state_cond.notify_all()
+
+    def wait_state(self, state: str, timeout: Optional[float] = None) -> bool:
+        """Blocks until the player is in the given state.
+
+        @param state: one of "idle", "buffering", "playing" or "paused"
+        @param timeout: seconds to wait at most, or None to wait for as long as it takes
+        @returns: True if the state was reached, False on timeout
+        """
+        with self._state_cond:
+            return self._state_cond.wait_for(lambda: self._state == state, timeout)
+
     def pause_audio(self):
         self.playing.clear()
+        if self.buffer:
+            self.buffer.reset()
+        self._set_state("paused")
 
     def resume_audio(self):
+        if self.buffer:
+            self.buffer.reset()
         self.playing.set()
+        self._set_state("playing")
         if not self.stream:
             self.setup_stream()
         if self.stream and not self.stream.is_active():
@@ -186,6 +640,8 @@ class AbstractTTS(ABC):
 
     def stop_audio(self):
         self.playing.clear()
+        if self.buffer:
+            self.buffer.reset()
         if self.play_thread and self.play_thread.is_alive():
             self.play_thread.join()
         with self.stream_lock:
@@ -196,6 +652,8 @@ class AbstractTTS(ABC):
         for timer in self.timers:
             timer.cancel()
         self.timers.clear()
+        self._set_state("idle")
+        self.done_event.set()
 
     def set_timings(self, timing_data):
         self.timings = timing_data
@@ -212,24 +670,43 @@ class AbstractTTS(ABC):
             self.callbacks[event_name](*args)
 
 
-    def start_playback_with_callbacks(self, ssml_text: bytes, callback=None):
-        if callback is None:
-            callback = self.on_word_callback
+    def start_playback_with_callbacks(self, ssml_text: bytes, callback=None, callback_batch=None):
+        """Speaks the text and reports each word as it is spoken.
 
+        Words are grouped into windows of WORD_BATCH_WINDOW seconds and each window is
+        dispatched from a single timer.
+
+        @param callback: called per word as callback(word), callback(word, start_time)
+            or callback(word, start_time, end_time), depending on how many arguments it takes
+        @param callback_batch: called once per window with a list of (word, start_time, end_time)
+        """
+        if callback is None and callback_batch is None:
+            callback = self.on_word_callback
         self.speak_streamed(ssml_text)
+        self._schedule_word_callbacks(callback, callback_batch)
+
+    def _schedule_word_callbacks(self, callback=None, callback_batch=None):
+        """Starts reporting the words in self.timings, counted from now."""
+        arity = _positional_arity(callback) if callback is not None else 0
         start_time = time.time()
-        for timing, word in self.timings:
+
+        def dispatch(batch):
             try:
-                delay = timing - (time.time() - start_time)
-                if delay > 0:
-                    timer = threading.Timer(delay, callback, args=(word, timing))
-                    timer.start()
-                    self.timers.append(timer)
+                if callback_batch is not None:
+                    callback_batch(batch)
+                if callback is not None:
+                    for word in batch:
+                        callback(*word[:arity])
             except Exception as e:
                 logging.error(f"Error in start_playback_with_callbacks: {e}")
+
+        dispatcher = WordDispatcher(_word_table(self.timings), dispatch, start_time)
+        dispatcher.start()
+        self.timers.append(dispatcher)
                 
     def finish(self):
         try:
+            self._close_output_streams()
             with self.stream_lock:
                 if self.stream and not self.stream.is_stopped():
                     self.stream.stop_stream()
@@ -262,7 +739,7 @@ class AbstractTTS(ABC):
 
     def _is_ssml(self, text: str) -> bool:
         """Determine if the input text is SSML."""
-        return bool(re.match(r'^\s*<speak>', text, re.IGNORECASE))
+        return bool(re.match(r'^\s*<speak[\s>]', text, re.IGNORECASE))
 
     def _convert_to_ssml(self, text: str) -> str:
         """Convert plain text to SSML with word markers."""